@@ -1,6 +1,7 @@
 # embedding_service\src\main.py
 
 from fastapi import FastAPI, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from shared_libs.embeddings.embedder_factory import EmbedderFactory
 from shared_libs.config.embedding_config import EmbeddingConfig
 from shared_libs.utils.logger import Logger
@@ -48,6 +49,7 @@ app = FastAPI(
     title="Embedding Service",
     description="Provides text embeddings using various pre-trained models.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 embedder_factory_instance: EmbedderFactory = None
@@ -1,4 +1,8 @@
 # download_model.py
+#
+# Run at image build time so the ONNX model is baked into cache_dir and cold starts
+# skip the HuggingFace download. At runtime, set OMP_NUM_THREADS to the container's
+# vCPU count to avoid ONNX Runtime thread over-subscription.
 
 import os
 import fastembed
@@ -16,9 +20,9 @@ def main():
     try:
         # Instantiate TextEmbedding to download the model
         embedder = fastembed.TextEmbedding(model_name=model_name, cache_dir=cache_dir)
-        # Optionally, you can perform a dummy embed to ensure the model is loaded
-        # For example:
-        # _ = embedder.embed("Test")
+        # embed() is lazy, so consume it. A batch of more than one input makes ONNX Runtime
+        # load the session and select its batched kernels before the first real request.
+        _ = list(embedder.embed(["warmup one", "warmup two"]))
         print(f"Model '{model_name}' downloaded successfully to '{cache_dir}'")
     except Exception as e:
         print(f"Failed to download the model '{model_name}': {e}")
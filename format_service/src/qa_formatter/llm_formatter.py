@@ -3,7 +3,9 @@
 import logging
 import json
 import yaml
+from pathlib import Path
 from typing import Optional, Dict, Any
+from shared_libs.config.yaml_io import parse_yaml_file
 from shared_libs.llm_providers import ProviderFactory  
 from shared_libs.llm_providers.llm_provider import LLMProvider
 
@@ -45,8 +47,8 @@ class LLMFormatter:
         :return: Dictionary of prompts.
         """
         try:
-            with open(prompts_path, 'r', encoding='utf-8') as file:
-                prompts = yaml.safe_load(file)
+            # libyaml-backed parse straight from the file handle (see shared_libs.config)
+            prompts = parse_yaml_file(Path(prompts_path))
             logger.info(f"Loaded prompts from '{prompts_path}'.")
             return prompts.get('prompts', {})
         except FileNotFoundError:
@@ -1,10 +1,11 @@
 # utils/validation.py
 
 import json
-import yaml
 import logging
 import re
+from pathlib import Path
 from langdetect import detect
+from shared_libs.config.yaml_io import parse_yaml_file
 from shared_libs.llm_providers.groq_provider import GroqProvider
 from jsonschema import validate, ValidationError
 from typing import Dict, Any, Optional
@@ -21,8 +22,7 @@ def load_schema(schema_path):
     :return: Parsed schema as a Python dictionary.
     """
     try:
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = yaml.safe_load(f)
+        schema = parse_yaml_file(Path(schema_path))
         logger.info(f"Loaded schema from '{schema_path}'.")
         return schema
     except Exception as e:
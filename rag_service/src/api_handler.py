@@ -4,6 +4,7 @@ import os
 import boto3
 import json
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from mangum import Mangum
@@ -11,12 +12,13 @@ import uuid
 import asyncio
 import time
 from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from hashlib import md5
 from services.intention_detector import IntentionDetector
 
 # Import from shared_libs
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.utils.logger import Logger
 
 import sys
@@ -28,7 +30,7 @@ from models.query_model import QueryModel
 from services.query_rag import query_rag  
 
 # Load configuration and initialize logger
-config = AppConfigLoader()
+config = get_app_config()
 logger = Logger.get_logger(module_name=__name__)
 
 # Environment variables
@@ -56,11 +58,15 @@ sqs_client = boto3.client(
     endpoint_url=endpoint_url
 )
 
+# Dedicated pool for blocking boto3 calls so they never starve the default executor,
+# which the embedding and Qdrant paths rely on.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
 # Initialize IntentionDetector
 intention_detector = IntentionDetector()
 
 # Initialize FastAPI application
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Allow origins as needed
 allowed_origins = [
@@ -188,13 +194,13 @@ class LambdaWorkerProcessor(Processor):
         message_body = json.dumps(payload)
         self.logger.debug(f"Enqueuing message to SQS: {message_body}")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         send_message_partial = partial(
             self.sqs_client.send_message,
             QueueUrl=self.sqs_queue_url,
             MessageBody=message_body
         )
-        response = await loop.run_in_executor(None, send_message_partial)
+        response = await loop.run_in_executor(_EXECUTOR, send_message_partial)
         self.logger.debug(f"Message enqueued to SQS with MessageId: {response.get('MessageId')}")
 
 # Development Processor (Local Processing)
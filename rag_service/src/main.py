@@ -9,11 +9,12 @@ from hashlib import md5
 
 import boto3
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from mangum import Mangum
 
 # Import from shared_libs
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.utils.logger import Logger
 
 # Import internal model and services
@@ -21,7 +22,7 @@ from models.query_model import QueryModel
 from rag_service.src.services.deprecated.query_rag_v1 import query_rag
 
 # Initialize configuration and logger
-config = AppConfigLoader()
+config = get_app_config()
 logger = Logger.get_logger(module_name=__name__)
 
 # Environment variables
@@ -51,7 +52,7 @@ sqs_client = boto3.client(
 )
 
 # Initialize FastAPI application
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Entry point for AWS Lambda using Mangum
 handler = Mangum(app)
@@ -6,7 +6,9 @@ from typing import Optional, Literal
 
 class BaseEmbeddingConfig(BaseModel):
     provider: str = Field(..., description="The embedding provider (e.g., local, docker, cloud, bedrock, groq_embedding, openai_embedding, google_gemini_embedding, ollama_embedding)")
-    model_config = {"protected_namespaces": ()}
+    # defer_build (inherited by every provider config): build core schemas on first use,
+    # since a process imports all variants but instantiates only one or two
+    model_config = {"protected_namespaces": (), "defer_build": True}
     @field_validator('provider')
     def validate_provider(cls, v):
         allowed = {'local', 'docker', 'cloud', 'bedrock', 'groq_embedding', 'openai_embedding', 'google_gemini_embedding', 'ollama_embedding'}
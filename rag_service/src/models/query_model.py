@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, ClassVar
 import time
 from hashlib import md5
-import json
+import orjson
 from pathlib import Path
 import uuid
 from shared_libs.utils.logger import Logger
@@ -100,6 +100,16 @@ class QueryModel(BaseModel):
         if not self.cache_key:
             self.cache_key = self._generate_cache_key(self.query_text)
 
+    @classmethod
+    def from_trusted(cls, **data) -> 'QueryModel':
+        """
+        Build a QueryModel from already-validated data (e.g. a queued message enqueued by the
+        API from a validated QueryModel) without re-running field validation.
+        """
+        if not data.get("cache_key"):
+            data["cache_key"] = cls._generate_cache_key(data["query_text"])
+        return cls.model_construct(**data)
+
     @staticmethod
     def _generate_cache_key(query_text: str) -> str:
         """Generate a consistent cache key by hashing the normalized query text."""
@@ -138,7 +148,7 @@ class QueryModel(BaseModel):
         table = cls.dynamodb_resource.Table(cache_table_name)
         logger.debug(f"Querying DynamoDB Table: {cache_table_name} with query_id: {query_id}")
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
+            response = await asyncio.get_running_loop().run_in_executor(
                 cls.executor,
                 partial(
                     table.query,
@@ -172,7 +182,7 @@ class QueryModel(BaseModel):
 
         logger.debug(f"Querying DynamoDB Table: {cache_table_name} using GSI: {gsi_name} for cache_key: {cache_key}")
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
+            response = await asyncio.get_running_loop().run_in_executor(
                 cls.executor,
                 partial(
                     table.query,
@@ -223,7 +233,7 @@ class QueryModel(BaseModel):
             # Convert the QueryModel to a DynamoDB-compatible dict
             item = self.as_ddb_item()
 
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 self.executor,
                 partial(
                     table.put_item,
@@ -278,7 +288,7 @@ class QueryModel(BaseModel):
                    }
             
 
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 self.executor,
                 partial(
                     table.update_item,
@@ -312,7 +322,7 @@ class QueryModel(BaseModel):
             if LOCAL_QUERY_FILE.exists():
                 async with aiofiles.open(LOCAL_QUERY_FILE, 'r', encoding='utf-8') as f:
                     content = await f.read()
-                    data = json.loads(content)
+                    data = orjson.loads(content)
 
             # Update or append the entry
             found = False
@@ -326,7 +336,7 @@ class QueryModel(BaseModel):
                 data.append(self.dict())
 
             async with aiofiles.open(LOCAL_QUERY_FILE, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, indent=2))
+                await f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8'))
 
             logger.debug(f"Query data saved locally: {self.query_id}")
         except Exception as e:
@@ -350,7 +360,7 @@ class QueryModel(BaseModel):
             if LOCAL_QUERY_FILE.exists():
                 async with aiofiles.open(LOCAL_QUERY_FILE, 'r', encoding='utf-8') as f:
                     content = await f.read()
-                    data = json.loads(content)
+                    data = orjson.loads(content)
                     for item in data:
                         if item.get("query_id") == query_id:
                             logger.info(f"Query data loaded from local storage for query_id: {query_id}")
@@ -377,7 +387,7 @@ class QueryModel(BaseModel):
             if LOCAL_QUERY_FILE.exists():
                 async with aiofiles.open(LOCAL_QUERY_FILE, 'r', encoding='utf-8') as f:
                     content = await f.read()
-                    data = json.loads(content)
+                    data = orjson.loads(content)
                     for item in data:
                         if item.get("cache_key") == cache_key:
                             logger.info(f"Query data loaded from local storage for cache_key: {cache_key}")
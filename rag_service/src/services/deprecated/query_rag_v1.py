@@ -129,7 +129,8 @@ async def query_rag(
     conversation_history,
     provider: Optional[LLMProvider] = None,
     embedding_mode: Optional[str] = None,
-    llm_provider_name: Optional[str] = None
+    llm_provider_name: Optional[str] = None,
+    retrieved_docs: Optional[List[Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Perform Retrieval-Augmented Generation (RAG) to answer the user's query.
@@ -138,6 +139,8 @@ async def query_rag(
     :param provider: (Optional) An initialized LLM provider.
     :param embedding_mode: (Optional) 'local' or 'api' to override the default embedding mode.
     :param llm_provider_name: (Optional) Name of the LLM provider to use if provider is not initialized.
+    :param retrieved_docs: (Optional) Documents already retrieved for the query, e.g. by the SQS
+           worker's batched search; the embedding and Qdrant search steps are then skipped.
     :return: A dictionary containing the response and, if DEVELOPMENT_MODE is enabled, retrieved_docs.
     """
     from services.search_qdrant import search_qdrant
@@ -164,33 +167,35 @@ async def query_rag(
             # Use default provider
             provider = llm_provider
 
-    # Determine the embedding mode
-    current_embedding_mode = embedding_mode.lower() if embedding_mode else config.get('embedding', {}).get('mode', 'local').lower()
+    if retrieved_docs is None:
+        # Determine the embedding mode
+        current_embedding_mode = embedding_mode.lower() if embedding_mode else config.get('embedding', {}).get('mode', 'local').lower()
+
+        # Get the embedding function based on the mode
+        embedding_function = get_embedding_function()
+        embedding_vector = None
+
+        if current_embedding_mode in ["local", "api"]:
+            try:
+                embedding_vector = await embedding_function(query_text)
+                if embedding_vector is None:
+                    raise ValueError("Embedding vector is None.")
+            except Exception as e:
+                logger.error(f"Failed to generate embedding for query '{query_text}': {e}")
+                return {
+                    "query_response": QueryResponse(
+                        query_text=query_text,
+                        response_text="An error occurred while creating embedding.",
+                        sources=[],
+                        timestamp=int(time.time())
+                    ),
+                    "retrieved_docs": [] if DEVELOPMENT_MODE else None
+                }
+
+        # Retrieve similar documents using Qdrant
+        logger.debug(f"Retrieving documents related to query: '{query_text}'")
+        retrieved_docs = await search_qdrant(embedding_vector, top_k=6)
 
-    # Get the embedding function based on the mode
-    embedding_function = get_embedding_function()
-    embedding_vector = None
-
-    if current_embedding_mode in ["local", "api"]:
-        try:
-            embedding_vector = await embedding_function(query_text)
-            if embedding_vector is None:
-                raise ValueError("Embedding vector is None.")
-        except Exception as e:
-            logger.error(f"Failed to generate embedding for query '{query_text}': {e}")
-            return {
-                "query_response": QueryResponse(
-                    query_text=query_text,
-                    response_text="An error occurred while creating embedding.",
-                    sources=[],
-                    timestamp=int(time.time())
-                ),
-                "retrieved_docs": [] if DEVELOPMENT_MODE else None
-            }
-
-    # Retrieve similar documents using Qdrant
-    logger.debug(f"Retrieving documents related to query: '{query_text}'")
-    retrieved_docs = await search_qdrant(embedding_vector, top_k=6)
     # Reconstruct sources for documents where source is None
     for doc in retrieved_docs:
         if not doc.get("source"):
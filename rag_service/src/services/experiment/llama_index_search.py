@@ -27,7 +27,7 @@ from shared_libs.config.embedding_config import EmbeddingConfig
 from shared_libs.embeddings.embedder_factory import EmbedderFactory
 from shared_libs.utils.logger import Logger
 
-from qdrant_client import QdrantClient  # Ensure qdrant-client is installed
+from ..qdrant_init import initialize_qdrant
 
 # Load environment variables from .env file if present
 load_dotenv(find_dotenv())
@@ -51,8 +51,6 @@ class LlamaIndexDataHandler:
         # Retrieve necessary environment variables
         input_dir = os.getenv('INPUT_DIR')
         collection_name = os.getenv('QA_COLLECTION_NAME')
-        qdrant_url = os.getenv('QDRANT_URL')
-        qdrant_api_key = os.getenv('QDRANT_API_KEY')
         llm_provider = os.getenv('LLM_PROVIDER', 'groq')  # e.g., 'groq', 'openai', etc.
 
         # Initialize Settings
@@ -70,9 +68,9 @@ class LlamaIndexDataHandler:
             logger.error(f"Failed to initialize embedder: {e}")
             raise e
 
-        # Initialize Qdrant client
+        # Reuse the process-wide Qdrant client (shared gRPC channel) instead of opening a new one
         try:
-            self.qdrant_client = QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
+            self.qdrant_client = initialize_qdrant()
             logger.info("Initialized Qdrant client successfully.")
         except Exception as e:
             logger.error(f"Failed to initialize Qdrant client: {e}")
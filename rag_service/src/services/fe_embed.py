@@ -5,11 +5,11 @@ import numpy as np
 from typing import List
 import fastembed  
 from shared_libs.llm_providers import ProviderFactory  
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.utils.logger import Logger
 
 # Load configuration from shared_libs
-config_loader = AppConfigLoader()
+config_loader = get_app_config()
 logger = Logger.get_logger(module_name=__name__)
 
 # Load embedding configuration from the global config
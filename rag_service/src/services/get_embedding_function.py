@@ -4,11 +4,11 @@ import os
 import asyncio
 from typing import Callable, List, Optional, Awaitable
 from shared_libs.utils.logger import Logger
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.config.embedding_config import EmbeddingConfig
 from shared_libs.embeddings.embedder_factory import EmbedderFactory
 
-app_config=AppConfigLoader()
+app_config=get_app_config()
 logger = Logger.get_logger(module_name=__name__)
 
 
@@ -2,10 +2,10 @@ from typing import List, Dict, Tuple
 import json
 from shared_libs.llm_providers import ProviderFactory
 from shared_libs.utils.logger import Logger
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 import re
 
-config=AppConfigLoader()
+config=get_app_config()
 llm_provider_name=config.get('llm', {}).get('provider', 'groq')
 llm_config = config.get('llm', {}).get(llm_provider_name, {})
 
@@ -16,7 +16,7 @@ logger = Logger.get_logger(module_name="IntentionDetector")
 class IntentionDetector:
     def __init__(self, provider=None, max_retries=3):
         # Load configurations
-        config = AppConfigLoader()
+        config = get_app_config()
         groq_config = config.get('llm', {}).get('groq', {})
         
         # Retrieve the API key
@@ -13,14 +13,14 @@ from services.qdrant_init import initialize_qdrant
 from shared_libs.config import Config
 
 from shared_libs.utils.logger import Logger
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.config.embedding_config import EmbeddingConfig
 from shared_libs.embeddings.embedder_factory import EmbedderFactory
 from shared_libs.llm_providers import ProviderFactory
 
 # Load configuration and initialize Qdrant client and embedder as before
 config = Config.load()
-app_config = AppConfigLoader()
+app_config = get_app_config()
 qdrant_client = initialize_qdrant()
 logger = Logger.get_logger("QA formatter")
 
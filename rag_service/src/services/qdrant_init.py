@@ -1,10 +1,35 @@
+from typing import Optional
 from qdrant_client import QdrantClient
 from shared_libs.utils.logger import Logger
 from shared_libs.config import Config
 
 logger = Logger.get_logger(module_name=__name__)
 
+# Keep the gRPC channel alive between bursts; overlapping searches multiplex over its
+# single HTTP/2 connection, up to the stream limit the server advertises.
+_GRPC_OPTIONS = {
+    "grpc.keepalive_time_ms": 10_000,
+    "grpc.keepalive_timeout_ms": 5_000,
+    "grpc.http2.max_pings_without_data": 0,
+}
+
+# Transport settings shared by the local and remote clients.
+_CLIENT_OPTIONS = {
+    "prefer_grpc": True,
+    "grpc_port": 6334,
+    "grpc_options": _GRPC_OPTIONS,
+    "pool_size": 64,
+    "timeout": 30,
+}
+
+_client: Optional[QdrantClient] = None
+
 def initialize_qdrant() -> QdrantClient:
+    global _client
+    # Re-entrant callers (e.g. Lambda cold paths) share one client and its channel.
+    if _client is not None:
+        return _client
+
     # Load your configuration from your unified Config
     config = Config.load()
     qdrant_conf = config.qdrant
@@ -12,12 +37,13 @@ def initialize_qdrant() -> QdrantClient:
 
     if local:
         logger.info("Using local Qdrant server.")
-        client = QdrantClient(url="http://localhost:6333")
+        client = QdrantClient(url="http://localhost:6333", **_CLIENT_OPTIONS)
     else:
         client = QdrantClient(
             url=qdrant_conf.api.url,
             api_key=qdrant_conf.api.api_key,
-            prefer_grpc=True
+            **_CLIENT_OPTIONS
         )
         logger.info("Using remote Qdrant server.")
+    _client = client
     return client
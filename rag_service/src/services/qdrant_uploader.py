@@ -11,12 +11,17 @@ from qdrant_client.http import models as qmodels
 from shared_libs.utils.logger import Logger
 from shared_libs.models.record_model import Record
 from shared_libs.embeddings.embedder_factory import EmbedderFactory
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.config.embedding_config import EmbeddingConfig
 
 
 from .qdrant_init import initialize_qdrant
-from .qdrant_utils import ensure_collection_exists, check_duplicate_point
+from .qdrant_utils import (
+    ensure_collection_exists,
+    ensure_payload_index,
+    check_duplicate_point,
+    tokenize_keywords,
+)
 
 
 logger = Logger.get_logger(module_name="Qdrant Uploader")
@@ -26,7 +31,7 @@ logger = Logger.get_logger(module_name="Qdrant Uploader")
 # ---------------------------------------------------------------------------
 # Configuration & initialization
 # ---------------------------------------------------------------------------
-app_config = AppConfigLoader()
+app_config = get_app_config()
 embedding_config = EmbeddingConfig.get_embed_config(app_config)
 factory = EmbedderFactory(embedding_config)
 
@@ -44,6 +49,7 @@ expected_dim = embedding_config.get_vector_dimension()
 _qcfg = app_config.get("qdrant", {}) or {}
 collection_names = (_qcfg.get("collection_names", {}) or {})
 DISTANCE_METRIC: str = _qcfg.get("distance_metric", "cosine").lower() # "cosine" or "dot"/"dotproduct"
+QUANTIZATION: str = _qcfg.get("quantization", "scalar").lower() # "scalar" (int8) or "binary"
 QA_COLLECTION_NAME = collection_names.get("qa_collection", "legal_qa")
 DOC_COLLECTION_NAME = collection_names.get("doc_collection", "legal_doc")
 
@@ -71,7 +77,17 @@ def _log_config_banner():
 
 
 def _ensure_collection(collection_name: str):
-    ensure_collection_exists(qdrant_client, collection_name, expected_dim, DISTANCE_METRIC)
+    ensure_collection_exists(qdrant_client, collection_name, expected_dim, DISTANCE_METRIC, QUANTIZATION)
+    ensure_payload_index(qdrant_client, collection_name, "keywords")
+    # Required by the group_by="record_id" searches in search_qdrant.
+    ensure_payload_index(qdrant_client, collection_name, "record_id")
+
+
+def _build_payload(record: Record) -> dict:
+    """Record payload plus the tokenized 'keywords' field used by keyword-filtered search."""
+    payload = record.to_dict()
+    payload["keywords"] = tokenize_keywords(record.content)
+    return payload
 
 # ---------------------------------------------------------------------------
 # Single-record upsert
@@ -107,7 +123,7 @@ def add_record_to_qdrant(record: Record, collection_name: Optional[str] = None)
                 qmodels.PointStruct(
                     id=record.record_id,
                     vector=embedding,
-                    payload=record.to_dict()
+                    payload=_build_payload(record)
                 )
             ]
         )
@@ -156,7 +172,7 @@ def add_records_to_qdrant(records: List[Record], collection_name: Optional[str]
             qmodels.PointStruct(
             id=rec.record_id or str(uuid.uuid4()),
             vector=vec,
-            payload=rec.to_dict(),
+            payload=_build_payload(rec),
             )
         )
 
@@ -4,11 +4,32 @@ from qdrant_client.http.exceptions import UnexpectedResponse
 from shared_libs.utils.logger import Logger
 from qdrant_client import QdrantClient
 from typing import List
+import re
 
 
 logger = Logger.get_logger(module_name="QdrantUtils")
 
-def ensure_collection_exists(client:QdrantClient, collection_name: str, expected_dim: int, distance_metric: str):
+# Quantized copies kept in RAM: Qdrant scores candidates on the quantized vectors and
+# search_qdrant rescores them against the originals (rescore=True) to recover recall.
+# Binary (1 bit/dim, XOR-popcount distances) suits high-dimensional models (~1024+ dims);
+# int8 scalar is the safer default for the 384/768-dim sentence-transformers models.
+QUANTIZATION_CONFIGS = {
+    "scalar": qdrant_models.ScalarQuantization(
+        scalar=qdrant_models.ScalarQuantizationConfig(
+            type=qdrant_models.ScalarType.INT8,
+            always_ram=True
+        )
+    ),
+    "binary": qdrant_models.BinaryQuantization(
+        binary=qdrant_models.BinaryQuantizationConfig(always_ram=True)
+    ),
+}
+
+# Candidate oversampling before rescoring; binary codes are coarser, so fetch more.
+QUANTIZATION_OVERSAMPLING = {"scalar": 2.0, "binary": 4.0}
+
+def ensure_collection_exists(client:QdrantClient, collection_name: str, expected_dim: int, distance_metric: str,
+                             quantization: str = "scalar"):
     """
     Ensure that the Qdrant collection exists with the expected vector dimension.
     If the collection does not exist, create it.
@@ -18,6 +39,7 @@ def ensure_collection_exists(client:QdrantClient, collection_name: str, expected
     :param collection_name: Name of the collection.
     :param expected_dim: Expected vector dimension (e.g., 768).
     :param distance_metric: Distance metric as a string (e.g., "cosine").
+    :param quantization: Quantization for new collections: "scalar" (int8) or "binary".
     """
     # Convert distance metric to enum.
     distance_metric_enum = {
@@ -31,6 +53,11 @@ def ensure_collection_exists(client:QdrantClient, collection_name: str, expected
         logger.error(f"Unsupported distance metric '{distance_metric}'.")
         raise ValueError(f"Unsupported distance metric '{distance_metric}'.")
 
+    quantization_config = QUANTIZATION_CONFIGS.get(quantization.lower())
+    if quantization_config is None:
+        logger.error(f"Unsupported quantization '{quantization}'.")
+        raise ValueError(f"Unsupported quantization '{quantization}'.")
+
     try:
         info = client.get_collection(collection_name=collection_name)
         # Use safe nested get() to retrieve the vector size.
@@ -46,7 +73,8 @@ def ensure_collection_exists(client:QdrantClient, collection_name: str, expected
             logger.info(f"Collection '{collection_name}' not found. Creating new collection with dimension {expected_dim}.")
             client.create_collection(
                 collection_name=collection_name,
-                vectors_config=VectorParams(size=expected_dim, distance=distance_metric_enum)
+                vectors_config=VectorParams(size=expected_dim, distance=distance_metric_enum),
+                quantization_config=quantization_config
             )
             logger.info(f"Collection '{collection_name}' created successfully.")
         else:
@@ -54,6 +82,49 @@ def ensure_collection_exists(client:QdrantClient, collection_name: str, expected
             raise
 
 
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize_keywords(text: str) -> List[str]:
+    """
+    Split text into the lowercase, de-duplicated tokens stored in the 'keywords' payload field.
+    The same tokenizer is applied to search keywords so both sides match exactly.
+
+    :param text: Text to tokenize.
+    :return: Unique tokens in order of first appearance.
+    """
+    if not text:
+        return []
+    return list(dict.fromkeys(_TOKEN_RE.findall(text.lower())))
+
+
+def ensure_payload_index(client: QdrantClient, collection_name: str, field_name: str,
+                         field_schema=qdrant_models.PayloadSchemaType.KEYWORD):
+    """
+    Ensure a payload index exists for the given field, so this is safe to call on every
+    startup. An "already exists" error from the server is treated as success; any other
+    failure is logged and raised, since searches filtering or grouping on the field need it.
+
+    :param client: An initialized Qdrant client.
+    :param collection_name: Name of the collection.
+    :param field_name: Payload field to index.
+    :param field_schema: Index type (defaults to KEYWORD).
+    """
+    try:
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=field_schema
+        )
+        logger.debug(f"Payload index on '{field_name}' ensured for collection '{collection_name}'.")
+    except Exception as e:
+        if "already exists" in str(e).lower():
+            logger.debug(f"Payload index on '{field_name}' already exists in collection '{collection_name}'.")
+        else:
+            logger.error(f"Failed to create payload index on '{field_name}' in collection '{collection_name}': {e}")
+            raise
+
+
 def check_duplicate_point(client, collection_name: str, vector: List[float], threshold: float = 0.9999) -> bool:
     """
     Check whether a given vector is a duplicate of an existing point in the specified Qdrant collection.
@@ -1,7 +1,9 @@
 # rag_service/src/services/query_rag.py
 from dataclasses import dataclass
+from collections import OrderedDict
 from typing import List, Optional, Dict, Any, Callable
 import time
+import inspect
 import sys
 import os
 import re
@@ -15,24 +17,21 @@ from shared_libs.llm_providers.llm_provider import LLMProvider
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
-try:
-    from .search_qdrant import search_qdrant, reconstruct_source, advanced_qdrant_search
-except:
-    from services.search_qdrant import search_qdrant, reconstruct_source, advanced_qdrant_search
+from .search_qdrant import search_qdrant, search_qdrant_multi, reconstruct_source, advanced_qdrant_search
 
 # Imports from shared_libs
 from shared_libs.llm_providers import ProviderFactory
 from shared_libs.utils.logger import Logger
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.config.prompt_config import PromptConfigLoader
 from shared_libs.config.embedding_config import EmbeddingConfig
 from shared_libs.embeddings.embedder_factory import EmbedderFactory 
 
 # Load configuration
-app_config = AppConfigLoader()
+app_config = get_app_config()
 config = app_config.config
 EMBEDDING_MODE = os.getenv('EMBEDDING_MODE','local')
-embedding_config = EmbeddingConfig.from_config_loader(app_config)
+embedding_config = EmbeddingConfig.get_embed_config(app_config)
 factory = EmbedderFactory(embedding_config)
 embedding_function = factory.create_embedder(EMBEDDING_MODE)  
 
@@ -42,8 +41,8 @@ logger = Logger.get_logger(module_name=__name__)
 prompt_config = PromptConfigLoader()
 
 # Load the RAG prompt from config
-rag_prompt = prompt_config.get_prompt('prompts').get('rag_prompt', {}).get('system_prompt', '')
-keyword_extraction_prompt = prompt_config.get_prompt('prompts').get('enrichment').get('keyword_extraction_prompt', '')
+rag_prompt = prompt_config.get_prompt('prompts.rag_prompt.system_prompt')
+keyword_extraction_prompt = prompt_config.get_prompt('prompts.enrichment.keyword_extraction_prompt')
 # Log an appropriate warning if the prompt is empty
 if not rag_prompt:
     logger.warning("RAG system prompt is empty or not found in prompts configuration.")
@@ -84,17 +83,42 @@ def initialize_provider(llm_provider_name: Optional[str] = None) -> LLMProvider:
         provider = llm_provider
     return provider
 
+def _bind_embed(embedding_function) -> Callable:
+    """
+    Resolve an embedder instance to its bound embed method; plain (sync or async)
+    callables are returned unchanged.
+    """
+    embed = getattr(embedding_function, 'embed', None)
+    if callable(embed):
+        return embed
+    if callable(embedding_function):
+        return embedding_function
+    raise ValueError("Invalid embedding function provided.")
+
+# Embedding mode -> bound embed callable, built once per mode instead of per query.
+_EMBED_MODES = {"api": "cloud", "local": "local"}
+_embed_fns: Dict[str, Callable] = {
+    mode: _bind_embed(embedding_function)
+    for mode, provider in _EMBED_MODES.items() if provider == EMBEDDING_MODE
+}
+
+def _embed_fn_for_mode(mode: str) -> Callable:
+    embed_fn = _embed_fns.get(mode)
+    if embed_fn is None:
+        if mode not in _EMBED_MODES:
+            raise ValueError(f"Unsupported embedding mode: {mode}")
+        embed_fn = _embed_fns[mode] = _bind_embed(factory.create_embedder(_EMBED_MODES[mode]))
+    return embed_fn
+
 async def generate_embedding(query_text: str, embedding_function: Callable) -> Optional[np.ndarray]:
     """
     Generate the embedding vector for the query using the provided embedding function.
+    Accepts an embedder instance or an already-bound (sync or async) embed callable.
     """
     try:
-        if callable(getattr(embedding_function, 'embed', None)):
-            embedding_vector = embedding_function.embed(query_text)
-        elif callable(embedding_function):
-            embedding_vector = await embedding_function(query_text)
-        else:
-            raise ValueError("Invalid embedding function provided.")
+        embedding_vector = _bind_embed(embedding_function)(query_text)
+        if inspect.isawaitable(embedding_vector):
+            embedding_vector = await embedding_vector
 
         if embedding_vector is None:
             raise ValueError("Embedding vector is None.")
@@ -105,6 +129,24 @@ async def generate_embedding(query_text: str, embedding_function: Callable) -> O
         logger.error(f"Failed to generate embedding for query '{query_text}': {e}")
         return None
 
+# Query embeddings keyed by (embedding mode, query text). RAG traffic repeats itself,
+# so a hit skips both embedder construction and the model call.
+_EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+def _cached_embedding(key: tuple) -> Optional[np.ndarray]:
+    vector = _embedding_cache.get(key)
+    if vector is not None:
+        _embedding_cache.move_to_end(key)
+    return vector
+
+def _store_embedding(key: tuple, vector: np.ndarray) -> None:
+    # Cached vectors are shared between requests, so make them read-only.
+    vector.setflags(write=False)
+    _embedding_cache[key] = vector
+    if len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+        _embedding_cache.popitem(last=False)
+
 async def retrieve_documents(embedding_vector: np.ndarray, top_k: int = 6) -> List[Dict]:
     """
     Retrieve similar documents using Qdrant.
@@ -196,8 +238,9 @@ async def extract_keywords(query_text: str, provider: LLMProvider, top_k: int =
         if not keyword_extraction_prompt:
             logger.error("Keyword extraction prompt not found in prompts.yaml.")
             return []
-        prompt = keyword_extraction_prompt.format(chunk_text=query_text, top_k=top_k)
-        logger.debug(f"Sending prompt to LLM for keyword extraction: {prompt}")
+        prompt = prompt_config.render('prompts.enrichment.keyword_extraction_prompt',
+                                      query_text=query_text, top_k=top_k)
+        logger.debug("Sending prompt to LLM for keyword extraction: %s", prompt)
         # logger.raw(f"Keyword extraction prompt sent: {prompt}")
         response = await provider.send_single_message(prompt=prompt)
         logger.raw(f"Keyword extraction raw response received: {response}")
@@ -205,12 +248,12 @@ async def extract_keywords(query_text: str, provider: LLMProvider, top_k: int =
         json_match = re.search(r'(?<=\{).*?(?=\})', response, re.DOTALL)
         if json_match:
             json_str = "{" + json_match.group(0) + "}"
-            logger.debug(f"LLM response (JSON extracted): {json_str}")
+            logger.debug("LLM response (JSON extracted): %s", json_str)
             try:
                 keywords_data = json.loads(json_str)
                 keywords = keywords_data.get("keywords", [])
                 if isinstance(keywords, list) and len(keywords) > 0:
-                    logger.debug(f"Extracted Keywords: {keywords}")
+                    logger.debug("Extracted Keywords: %s", keywords)
                     # logger.raw(f"Extracted Keywords: {keywords}")
                     return keywords
                 else:
@@ -224,7 +267,7 @@ async def extract_keywords(query_text: str, provider: LLMProvider, top_k: int =
             list_match = re.findall(r'\b\w+\b', response)
             if list_match:
                 keywords = list_match[:top_k]
-                logger.debug(f"Extracted Keywords from plain text: {keywords}")
+                logger.debug("Extracted Keywords from plain text: %s", keywords)
                 # logger.raw(f"Extracted Keywords from plain text: {keywords}")
                 return keywords
             else:
@@ -320,17 +363,15 @@ async def query_rag(
 
     current_embedding_mode = embedding_mode.lower() if embedding_mode else config.get('embedding', {}).get('mode', 'local').lower()
 
-    embedding_config = EmbeddingConfig.from_config_loader(app_config)
-    factory = EmbedderFactory(embedding_config)
-
-    if current_embedding_mode == "api":
-        embedding_function = factory.create_embedder('cloud')
-    elif current_embedding_mode == "local":
-        embedding_function = factory.create_embedder('local')
+    embedding_key = (current_embedding_mode, query_text)
+    embedding_vector = _cached_embedding(embedding_key)
+    if embedding_vector is None:
+        embedding_vector = await generate_embedding(query_text, _embed_fn_for_mode(current_embedding_mode))
+        if embedding_vector is not None:
+            _store_embedding(embedding_key, embedding_vector)
     else:
-        raise ValueError(f"Unsupported embedding mode: {current_embedding_mode}")
+        logger.debug("Embedding cache hit for query.")
 
-    embedding_vector = await generate_embedding(query_text, embedding_function)
     if embedding_vector is None:
         return {
             "query_response": QueryResponse(
@@ -353,17 +394,19 @@ async def query_rag(
     if keyword_gen:
         for attempt in range(2):
             try:
-                logger.debug(f"Attempt {attempt + 1}: Extracting keywords for query: {query_text}")
+                logger.debug("Attempt %d: Extracting keywords for query: %s", attempt + 1, query_text)
                 keywords = await extract_keywords(query_text, provider, top_k=10)
                 if isinstance(keywords, list) and len(keywords) > 0:
-                    logger.debug(f"Keywords extracted: {keywords}")
+                    logger.debug("Keywords extracted: %s", keywords)
                     # logger.raw(f"Keywords extracted: {keywords}")
                     extracted_keywords = keywords
-                    qa_docs = await advanced_qdrant_search(
-                        embedding_vector, keywords, collection_name=QA_COLLECTION_NAME, top_k=3
-                    )
-                    doc_chunks = await advanced_qdrant_search(
-                        embedding_vector, keywords, collection_name=DOC_COLLECTION_NAME, top_k=6
+                    qa_docs, doc_chunks = await asyncio.gather(
+                        advanced_qdrant_search(
+                            embedding_vector, keywords, collection_name=QA_COLLECTION_NAME, top_k=3
+                        ),
+                        advanced_qdrant_search(
+                            embedding_vector, keywords, collection_name=DOC_COLLECTION_NAME, top_k=6
+                        )
                     )
                     all_retrieved_docs = qa_docs + doc_chunks
                     break
@@ -374,13 +417,13 @@ async def query_rag(
 
         if not all_retrieved_docs:
             logger.warning("Falling back to normal search_qdrant due to keyword generation failure.")
-            qa_docs = await search_qdrant(embedding_vector, collection_name=QA_COLLECTION_NAME, top_k=3)
-            doc_chunks = await search_qdrant(embedding_vector, collection_name=DOC_COLLECTION_NAME, top_k=6)
-            all_retrieved_docs = qa_docs + doc_chunks
+            all_retrieved_docs = await search_qdrant_multi(
+                embedding_vector, {QA_COLLECTION_NAME: 3, DOC_COLLECTION_NAME: 6}
+            )
     else:
-        qa_docs = await search_qdrant(embedding_vector, collection_name=QA_COLLECTION_NAME, top_k=3)
-        doc_chunks = await search_qdrant(embedding_vector, collection_name=DOC_COLLECTION_NAME, top_k=6)
-        all_retrieved_docs = qa_docs + doc_chunks
+        all_retrieved_docs = await search_qdrant_multi(
+            embedding_vector, {QA_COLLECTION_NAME: 3, DOC_COLLECTION_NAME: 6}
+        )
 
     if not all_retrieved_docs:
         logger.warning(f"No relevant documents found for query: '{query_text}'")
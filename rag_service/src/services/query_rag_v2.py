@@ -59,13 +59,14 @@ async def query_rag(
         qdrant_config = global_config.qdrant
     else:
         # Create a dummy loader if necessary
-        from shared_libs.config.app_config import AppConfigLoader
-        app_config = AppConfigLoader()
+        from shared_libs.config.app_config import get_app_config
+        app_config = get_app_config()
     
     # Load embedding configuration if not provided.
     if embedding_config is None:
         from shared_libs.config.embedding_config import EmbeddingConfig
-        embedding_config = EmbeddingConfig.get_embed_config(app_config)
+        # Per-call path: the config was validated at startup, so skip re-validation here
+        embedding_config = EmbeddingConfig.from_config_loader(app_config)
     
     # Determine embedding mode, using environment variable or config defaults.
     if embedding_mode is None:
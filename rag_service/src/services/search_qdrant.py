@@ -1,39 +1,225 @@
 # rag_service/src/services/search_qdrant.py
 
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.utils.logger import Logger
-from qdrant_client.http.models import Filter, FieldCondition, MatchAny, MatchText
-from typing import List, Dict, Any, Optional
+from qdrant_client.http import models as qm
+from qdrant_client.http.models import Filter, FieldCondition, MatchAny
+from typing import List, Dict, Any, Optional, Union, NamedTuple
+from functools import lru_cache
+from operator import itemgetter
+from collections import OrderedDict
+from hashlib import blake2b
+import asyncio
+import logging
+import time
 import re
-import os
 import numpy as np
 
 logger = Logger.get_logger(module_name=__name__)
 
-DEVELOPMENT_MODE = os.getenv("DEVELOPMENT_MODE", "False").lower() in ["true", "1", "yes"]
-QDRANT_LOCAL_MODE = os.getenv("QDRANT_LOCAL_MODE", "False").lower() in ["true", "1", "yes"]
+from .qdrant_init import initialize_qdrant
+from .qdrant_utils import tokenize_keywords, QUANTIZATION_OVERSAMPLING
+
+# The Qdrant client is created on the first search rather than at import; initialize_qdrant
+# returns the process-wide client after that. The client is blocking, so searches run it
+# via asyncio.to_thread to keep the event loop free.
+
+# Load configuration once at import; searches without an explicit config reuse it.
+_CFG = get_app_config().config
+_QDRANT_CFG = _CFG.get('qdrant', {}) or {}
+_QA_COLLECTION = _QDRANT_CFG.get(
+    "QA_COLLECTION_NAME", (_QDRANT_CFG.get("collection_names") or {}).get("qa_collection", "legal_qa_768")
+)
+_DOC_COLLECTION = _QDRANT_CFG.get(
+    "DOC_COLLECTION_NAME", (_QDRANT_CFG.get("collection_names") or {}).get("doc_collection", "legal_doc_768")
+)
+
+class SearchHit(NamedTuple):
+    """A single search result: the consumed payload fields plus the similarity score."""
+    record_id: str
+    document_id: str
+    title: str
+    content: str
+    chunk_id: str
+    source: str
+    model_info: dict
+    similarity_score: float
+
+# Payload keys read into SearchHit, in field order, and their per-key defaults.
+# model_info defaults to None here and is replaced by a fresh dict per hit, since
+# a shared {} default would leak mutations between results.
+_KEYS = SearchHit._fields[:-1]
+_DEFAULTS = ("",) * (len(_KEYS) - 1) + (None,)
+
+# Only the payload fields consumed by the result extraction are requested.
+_FIELDS = qm.PayloadSelectorInclude(include=list(_KEYS))
+
+# Reads every payload key in one C-level call; payloads written by qdrant_uploader carry all of them.
+_get_fields = itemgetter(*_KEYS)
+
+def _to_hit(point) -> SearchHit:
+    """
+    Build a SearchHit from a scored Qdrant point. Callers annotate results in place
+    (e.g. filling in 'source'), so the search functions return hit._asdict().
+    """
+    payload = point.payload
+    try:
+        values = _get_fields(payload)
+    except KeyError:
+        # Older or hand-written points may lack fields; fall back to per-key defaults.
+        *values, model_info = map(payload.get, _KEYS, _DEFAULTS)
+        values = (*values, model_info if model_info is not None else {})
+    return SearchHit(*values, point.score)
+
+def _to_results(points) -> List[Dict[str, Any]]:
+    """
+    Convert already-deduplicated scored points into result dicts. The DEBUG check
+    is made once per call, so production runs skip the per-hit log calls entirely.
+    """
+    results = [_to_hit(point)._asdict() for point in points]
+    if logger.isEnabledFor(logging.DEBUG):
+        for doc in results:
+            logger.debug("Document ID: %s, Title: %s, Similarity Score: %.4f",
+                         doc["record_id"], doc["title"] or "N/A", doc["similarity_score"])
+    return results
+
+# Single-pass pattern used by reconstruct_source; the named group tells which part matched.
+_SOURCE_RE = re.compile(r'(?:art(?P<art>\d+)|cl_(?P<cl>\d+)|pt_(?P<pt>[^\W_]+))', re.IGNORECASE)
+
+# Collection name -> "qa" / "doc". Seeded from config; other names are classified once and stored.
+_COLLECTION_KINDS: Dict[str, str] = {_QA_COLLECTION: "qa", _DOC_COLLECTION: "doc"}
+
+def _collection_kind(collection_name: str) -> str:
+    """
+    Classify a collection as QA or DOC to pick its similarity threshold.
+    """
+    kind = _COLLECTION_KINDS.get(collection_name)
+    if kind is None:
+        collection_lower = collection_name.lower()
+        if "qa" in collection_lower:
+            kind = "qa"
+        elif "doc" in collection_lower:
+            kind = "doc"
+        else:
+            kind = "qa"
+        _COLLECTION_KINDS[collection_name] = kind
+    return kind
+
+def _coerce_vector(vector) -> Optional[np.ndarray]:
+    """
+    Validate a query embedding and coerce it to a contiguous float32 array. The array is
+    hashed for the result cache and turned into the wire list once with ndarray.tolist()
+    (a single C-level pass); qdrant-client's request models only validate plain float lists.
 
-try:
-    from .qdrant_init import initialize_qdrant
-except ImportError:
-    from services.qdrant_init import initialize_qdrant
+    :return: The coerced vector, or None (after logging) if it is missing, empty or not numeric.
+    """
+    try:
+        if len(vector) == 0:
+            raise ValueError("empty vector")
+        return np.ascontiguousarray(vector, dtype=np.float32)
+    except (TypeError, ValueError):
+        logger.error("Embedding vector must be a non-empty list or NumPy array.")
+        return None
 
-# Initialize Qdrant client (we assume this is OK to do globally)
-qdrant_client = initialize_qdrant()
+# Minimum HNSW beam width from the qdrant config block.
+_HNSW_EF = int(_QDRANT_CFG.get("hnsw_ef", 64))
+
+# Rescore oversampling matching the collections' quantization (see qdrant_utils).
+_OVERSAMPLING = QUANTIZATION_OVERSAMPLING.get(str(_QDRANT_CFG.get("quantization", "scalar")).lower(), 2.0)
+
+def _default_ef(top_k: int) -> int:
+    # The prefetch stage pools top_k * 4 candidates, and ef must cover that limit.
+    return max(_HNSW_EF, top_k * 4)
+
+def _search_params(hnsw_ef: int) -> qm.SearchParams:
+    """
+    Approximate-search parameters shared by the search functions.
+
+    The beam width defaults to _default_ef(top_k). indexed_only skips segments that are
+    still being indexed during ingestion instead of brute-force scanning them. The
+    quantization block only takes effect on collections created with a quantization_config
+    (scalar or binary); candidates are then scored on the quantized vectors and rescored
+    with the originals.
+    """
+    return qm.SearchParams(
+        hnsw_ef=hnsw_ef,
+        exact=False,
+        indexed_only=True,
+        quantization=qm.QuantizationSearchParams(ignore=False, rescore=True, oversampling=_OVERSAMPLING)
+    )
+
+def _prefetch(vectors: List[np.ndarray], top_k: int, hnsw_ef: int,
+              threshold: Optional[float] = None) -> List[qm.Prefetch]:
+    """
+    First retrieval stage: one HNSW candidate pool of top_k * 4 per query vector.
+    The outer query then rescores (or fuses) the pooled candidates, which leaves
+    enough headroom for the record_id grouping to still fill top_k groups.
+    """
+    return [
+        qm.Prefetch(query=v.tolist(), limit=top_k * 4, score_threshold=threshold, params=_search_params(hnsw_ef))
+        for v in vectors
+    ]
+
+def _default_collection(config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Resolve the default (QA) collection name, using the cached module config
+    unless the caller supplied its own.
+    """
+    if config is None:
+        return _QA_COLLECTION
+    return (config.get('qdrant', {}) or {}).get("QA_COLLECTION_NAME", _QA_COLLECTION)
+
+# Bounded LRU of search results keyed by query vector hash and search parameters.
+# Entries expire after _RESULT_CACHE_TTL seconds so re-ingested payloads show up.
+_RESULT_CACHE_SIZE = 1024
+_RESULT_CACHE_TTL = 1800
+_result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+def _cache_key(vectors: List[np.ndarray], collection_name: str, top_k: int, threshold: float, hnsw_ef: int) -> tuple:
+    h = blake2b(digest_size=16)
+    for v in vectors:
+        h.update(v.tobytes())
+    return (collection_name, top_k, threshold, hnsw_ef, len(vectors), h.digest())
+
+def _cache_get(key: tuple) -> Optional[List[Dict[str, Any]]]:
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, results = entry
+    if expires_at < time.monotonic():
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    # Callers mutate result dicts, so hand out copies.
+    return [dict(doc) for doc in results]
+
+def _cache_put(key: tuple, results: List[Dict[str, Any]]) -> None:
+    _result_cache[key] = (time.monotonic() + _RESULT_CACHE_TTL, [dict(doc) for doc in results])
+    _result_cache.move_to_end(key)
+    if len(_result_cache) > _RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
 
 async def search_qdrant(
-    embedding_vector: List[float],
+    embedding_vector: Union[List[float], np.ndarray],
     collection_name: Optional[str] = None,
     top_k: int = 3,
     qa_threshold: float = 0.7,
     doc_threshold: float = 0.8,
-    config: Optional[Dict[str, Any]] = None
+    config: Optional[Dict[str, Any]] = None,
+    hnsw_ef: Optional[int] = None,
+    fusion_vectors: Optional[List[Union[List[float], np.ndarray]]] = None
 ) -> List[Dict[str, Any]]:
     """
     Search Qdrant for documents similar to the query embedding and return only results 
     with similarity scores higher than the specified threshold for each category.
+
+    Retrieval runs in two stages via query_points prefetch: an HNSW candidate pool,
+    then rescoring of the pooled candidates. When fusion_vectors are given (e.g.
+    Matryoshka or paraphrased query embeddings), each vector gets its own prefetch
+    and the pools are merged with Reciprocal Rank Fusion; the threshold then applies
+    per prefetch, and similarity_score holds the RRF score.
     
-    If a configuration dictionary is not provided, it will be loaded via AppConfigLoader.
+    If a configuration dictionary is not provided, the configuration loaded at import is used.
     
     :param embedding_vector: The embedding vector of the query.
     :param collection_name: The name of the Qdrant collection to search.
@@ -41,88 +227,219 @@ async def search_qdrant(
     :param top_k: Number of top similar documents to retrieve.
     :param qa_threshold: Minimum similarity score threshold for QA records.
     :param doc_threshold: Minimum similarity score threshold for DOC records.
-    :param config: Optional configuration dictionary. If not provided, it will be loaded.
+    :param config: Optional configuration dictionary. If not provided, the cached one is used.
+    :param hnsw_ef: HNSW beam width; defaults to max(qdrant.hnsw_ef, top_k * 4). See _search_params.
+    :param fusion_vectors: Optional additional query embeddings to fuse with RRF.
     :return: List of dictionaries with document fields and similarity scores.
     """
-    if embedding_vector is None or len(embedding_vector) == 0:
-        logger.error("No embedding vector provided for Qdrant search.")
+    embedding_vector = _coerce_vector(embedding_vector)
+    if embedding_vector is None:
         return []
 
-    # Load config if not provided.
-    if config is None:
-        from shared_libs.config import Config
-        global_config = Config.load()
+    vectors = [embedding_vector]
+    for extra in fusion_vectors or ():
+        extra = _coerce_vector(extra)
+        if extra is None:
+            return []
+        vectors.append(extra)
 
-    # If no collection name was provided, load the QA collection name from config.
+    if hnsw_ef is None:
+        hnsw_ef = _default_ef(top_k)
+
+    # If no collection name was provided, use the QA collection from config.
     if collection_name is None:
-        collection_name = config.get('qdrant', {}).get("QA_COLLECTION_NAME", "legal_qa_768")
-    
-        # Also retrieve DOC_COLLECTION_NAME from config (if needed elsewhere).
-        QA_COLLECTION_NAME = global_config.app.config.get('qdrant', {}).get("QA_COLLECTION_NAME", "legal_qa_768")
-        DOC_COLLECTION_NAME = global_config.app.config.get('qdrant', {}).get("DOC_COLLECTION_NAME", "legal_doc_768")
+        collection_name = _default_collection(config)
+
+    # Determine the similarity threshold based on the collection name.
+    threshold = doc_threshold if _collection_kind(collection_name) == "doc" else qa_threshold
+
+    # Identical query vectors skip the Qdrant round-trip entirely.
+    cache_key = _cache_key(vectors, collection_name, top_k, threshold, hnsw_ef)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.debug("Search cache hit for collection '%s'.", collection_name)
+        return cached
 
     try:
-        logger.debug(f"Searching Qdrant for top {top_k} documents in collection '{collection_name}'.")
-        search_result = qdrant_client.search(
+        logger.debug("Searching Qdrant for top %d documents in collection '%s'.", top_k, collection_name)
+        # Qdrant drops hits below the threshold server-side, so they are never transferred,
+        # and groups by record_id so at most one hit per record comes back.
+        if len(vectors) > 1:
+            query = qm.FusionQuery(fusion=qm.Fusion.RRF)
+            prefetch = _prefetch(vectors, top_k, hnsw_ef, threshold)
+            score_threshold = None
+        else:
+            query = embedding_vector.tolist()
+            prefetch = _prefetch(vectors, top_k, hnsw_ef)
+            score_threshold = threshold
+        groups = (await asyncio.to_thread(
+            initialize_qdrant().query_points_groups,
             collection_name=collection_name,
-            query_vector=embedding_vector,
+            query=query,
+            prefetch=prefetch,
+            group_by="record_id",
+            group_size=1,
             limit=top_k,
-            with_payload=True
-        )
-
-        # Ensure unique results based on record_id.
-        unique_results = {}
-        for hit in search_result:
-            record_id = hit.payload.get("record_id", "")
-            if record_id not in unique_results:
-                unique_results[record_id] = hit
-        search_result = list(unique_results.values())
+            score_threshold=score_threshold,
+            with_payload=_FIELDS
+        )).groups
 
-        # Determine the similarity threshold based on the collection name.
-        collection_lower = collection_name.lower() if collection_name else ""
-        if "qa" in collection_lower:
-            threshold = qa_threshold
-        elif "doc" in collection_lower:
-            threshold = doc_threshold
-        else:
-            threshold = qa_threshold
-
-        # Extract and filter search results based on the threshold.
-        results = []
-        for hit in search_result:
-            payload = hit.payload
-            similarity_score = hit.score
-            if similarity_score >= threshold:
-                results.append({
-                    "record_id": payload.get("record_id", ""),
-                    "document_id": payload.get("document_id", ""),
-                    "title": payload.get("title", ""),
-                    "content": payload.get("content", ""),
-                    "chunk_id": payload.get("chunk_id", ""),
-                    "source": payload.get("source", ""),
-                    "model_info": payload.get("model_info", {}),
-                    "similarity_score": similarity_score
-                })
-                logger.debug(f"Document ID: {payload.get('record_id', '')}, "
-                             f"Title: {payload.get('title', 'N/A')}, "
-                             f"Similarity Score: {similarity_score:.4f}")
+        # Extract the search results.
+        results = _to_results(group.hits[0] for group in groups if group.hits)
 
         if results:
-            logger.debug(f"Found {len(results)} documents with similarity score >= {threshold}.")
+            logger.debug("Found %d documents with similarity score >= %s.", len(results), threshold)
         else:
             logger.warning("No documents found with similarity score above the threshold.")
 
+        _cache_put(cache_key, results)
         return results
     except Exception as e:
         logger.error(f"Error during Qdrant search: {e}")
         return []
 
+async def search_qdrant_multi(
+    embedding_vector: Union[List[float], np.ndarray],
+    collections: Dict[str, int],
+    config: Optional[Dict[str, Any]] = None,
+    **search_kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Search several collections concurrently and merge the hits.
+
+    The per-collection searches are awaited together, so the caller waits for the slowest
+    collection rather than the sum of all of them. A collection that fails contributes
+    no hits instead of failing the whole call.
+
+    :param embedding_vector: The embedding vector of the query.
+    :param collections: Mapping of collection name to its top_k, in merge order.
+    :param config: Optional configuration dictionary, passed to search_qdrant.
+    :param search_kwargs: Extra keyword arguments for search_qdrant (thresholds, hnsw_ef, ...).
+    :return: Merged hits, deduplicated by record_id, in collection order.
+    """
+    names = list(collections)
+    responses = await asyncio.gather(
+        *(search_qdrant(embedding_vector, collection_name=name, top_k=collections[name],
+                        config=config, **search_kwargs) for name in names),
+        return_exceptions=True
+    )
+
+    results = []
+    seen = set()
+    for name, hits in zip(names, responses):
+        if isinstance(hits, Exception):
+            logger.error(f"Error searching collection '{name}': {hits}")
+            continue
+        for hit in hits:
+            if hit["record_id"] in seen:
+                continue
+            seen.add(hit["record_id"])
+            results.append(hit)
+    return results
+
+# query_batch_points cannot group by record_id, so each batched query fetches this many
+# times top_k hits (the size of its prefetch pool) and keeps the best hit per record.
+_BATCH_OVERFETCH = 4
+
+def _distinct_records(points, limit: int) -> list:
+    """
+    Keep the first (best-scored) point per record_id, up to limit records.
+    """
+    seen = set()
+    distinct = []
+    for point in points:
+        record_id = point.payload.get("record_id")
+        if record_id in seen:
+            continue
+        seen.add(record_id)
+        distinct.append(point)
+        if len(distinct) == limit:
+            break
+    return distinct
+
+async def search_qdrant_batch(
+    vectors: List[Union[List[float], np.ndarray]],
+    collection_name: Optional[str] = None,
+    top_k: int = 3,
+    qa_threshold: float = 0.7,
+    doc_threshold: float = 0.8,
+    config: Optional[Dict[str, Any]] = None,
+    hnsw_ef: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Search Qdrant for several query embeddings in a single query_batch_points round trip,
+    e.g. the SQS worker's batch of messages.
+
+    Thresholds, the two-stage prefetch and the result cache work as in search_qdrant, and
+    only cache misses are sent. The groups endpoint has no batch form, so each query fetches
+    top_k * _BATCH_OVERFETCH hits and is de-duplicated by record_id on the client.
+
+    :param vectors: The embedding vectors of the queries.
+    :param collection_name: The Qdrant collection name; if not provided, defaults from config.
+    :param top_k: Number of top similar documents to retrieve per query.
+    :param qa_threshold: Minimum similarity score threshold for QA records.
+    :param doc_threshold: Minimum similarity score threshold for DOC records.
+    :param config: Optional configuration dictionary.
+    :param hnsw_ef: HNSW beam width; defaults to max(qdrant.hnsw_ef, top_k * 4). See _search_params.
+    :return: One list of result dictionaries per input vector, in the same order.
+    """
+    if not vectors:
+        logger.error("No embedding vectors provided for Qdrant batch search.")
+        return []
+
+    vectors = [_coerce_vector(v) for v in vectors]
+    if any(v is None for v in vectors):
+        return []
+
+    if hnsw_ef is None:
+        hnsw_ef = _default_ef(top_k)
+
+    if collection_name is None:
+        collection_name = _default_collection(config)
+
+    threshold = doc_threshold if _collection_kind(collection_name) == "doc" else qa_threshold
+
+    # Same keys as search_qdrant, so single and batched searches share cached results.
+    cache_keys = [_cache_key([v], collection_name, top_k, threshold, hnsw_ef) for v in vectors]
+    batch_results = [_cache_get(key) for key in cache_keys]
+    misses = [idx for idx, results in enumerate(batch_results) if results is None]
+    if not misses:
+        return batch_results
+
+    try:
+        logger.debug("Batch searching Qdrant with %d queries in collection '%s'.", len(misses), collection_name)
+        requests = [
+            qm.QueryRequest(
+                query=vectors[idx].tolist(),
+                prefetch=_prefetch([vectors[idx]], top_k, hnsw_ef),
+                limit=top_k * _BATCH_OVERFETCH,
+                score_threshold=threshold,
+                with_payload=_FIELDS
+            )
+            for idx in misses
+        ]
+        responses = await asyncio.to_thread(
+            initialize_qdrant().query_batch_points, collection_name=collection_name, requests=requests
+        )
+    except Exception as e:
+        logger.error(f"Error during Qdrant batch search: {e}")
+        for idx in misses:
+            batch_results[idx] = []
+        return batch_results
+
+    for idx, response in zip(misses, responses):
+        results = _to_results(_distinct_records(response.points, top_k))
+        _cache_put(cache_keys[idx], results)
+        batch_results[idx] = results
+    return batch_results
+
 async def advanced_qdrant_search(
-    embedding_vector: List[float],
+    embedding_vector: Union[List[float], np.ndarray],
     keywords: List[str],
     collection_name: Optional[str] = None,
     top_k: int = 10,
-    config: Optional[Dict[str, Any]] = None
+    config: Optional[Dict[str, Any]] = None,
+    hnsw_ef: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Perform an advanced search in Qdrant using both embedding vectors and keyword filtering.
@@ -132,82 +449,57 @@ async def advanced_qdrant_search(
     :param collection_name: The Qdrant collection name; if not provided, defaults from config.
     :param top_k: Number of top similar documents to retrieve.
     :param config: Optional configuration dictionary.
+    :param hnsw_ef: HNSW beam width; defaults to max(qdrant.hnsw_ef, top_k * 4). See _search_params.
     :return: List of dictionaries containing document fields and similarity scores.
     """
-    # Ensure embedding_vector is a list.
-    if isinstance(embedding_vector, np.ndarray):
-        embedding_vector = embedding_vector.tolist()
-    elif not isinstance(embedding_vector, list):
-        logger.error("Embedding vector must be a list or NumPy array.")
-        return []
-
-    if embedding_vector is None or len(embedding_vector) == 0:
-        logger.error("No embedding vector provided for Qdrant search.")
+    embedding_vector = _coerce_vector(embedding_vector)
+    if embedding_vector is None:
         return []
 
     if not isinstance(keywords, list):
         logger.error("Keywords must be a list.")
         return []
 
-    if keywords is None or len(keywords) == 0:
-        logger.error("No keywords provided for Qdrant search.")
-        return []
+    # Keywords go through the same tokenizer used at ingest time.
+    keyword_tokens = list(dict.fromkeys(
+        token for keyword in keywords for token in tokenize_keywords(keyword)
+    ))
 
-    if config is None:
-        config = AppConfigLoader().config
+    # Nothing to filter on: run the plain search rather than failing the caller.
+    if not keyword_tokens:
+        logger.debug("No usable keywords; falling back to unfiltered Qdrant search.")
+        return await search_qdrant(embedding_vector, collection_name, top_k, config=config, hnsw_ef=hnsw_ef)
 
     if collection_name is None:
-        collection_name = config.get('qdrant', {}).get("QA_COLLECTION_NAME", "legal_qa")
+        collection_name = _default_collection(config)
 
     try:
-        logger.debug(f"Performing advanced search in collection '{collection_name}' with top_k={top_k}.")
-
-        # Construct a filter to match any of the keywords in the 'content' field.
-        keyword_conditions = [
-            FieldCondition(
-                key="content",
-                match=MatchText(text=keyword)
-            ) for keyword in keywords
-        ]
+        logger.debug("Performing advanced search in collection '%s' with top_k=%d.", collection_name, top_k)
 
-        combined_filter = Filter(should=keyword_conditions)
+        # Match any of the keywords against the indexed 'keywords' payload field in one probe.
+        # A single condition goes straight into 'must'; no 'should' wrapper for the planner.
+        combined_filter = Filter(must=[
+            FieldCondition(key="keywords", match=MatchAny(any=keyword_tokens))
+        ])
 
         # Perform the search with both embedding and the constructed filter.
-        search_result = qdrant_client.search(
+        # Grouping by record_id returns at most one hit per record.
+        groups = (await asyncio.to_thread(
+            initialize_qdrant().query_points_groups,
             collection_name=collection_name,
-            query_vector=embedding_vector,
+            query=embedding_vector.tolist(),
             query_filter=combined_filter,
+            group_by="record_id",
+            group_size=1,
             limit=top_k,
-            with_payload=True
-        )
+            with_payload=_FIELDS,
+            search_params=_search_params(hnsw_ef if hnsw_ef is not None else _default_ef(top_k))
+        )).groups
 
-        unique_results = {}
-        for hit in search_result:
-            record_id = hit.payload.get("record_id", "")
-            if record_id and record_id not in unique_results:
-                unique_results[record_id] = hit
-        search_result = list(unique_results.values())
-
-        results = []
-        for hit in search_result:
-            payload = hit.payload
-            similarity_score = hit.score
-            results.append({
-                "record_id": payload.get("record_id", ""),
-                "document_id": payload.get("document_id", ""),
-                "title": payload.get("title", ""),
-                "content": payload.get("content", ""),
-                "chunk_id": payload.get("chunk_id", ""),
-                "source": payload.get("source", ""),
-                "model_info": payload.get("model_info", {}),
-                "similarity_score": similarity_score
-            })
-            logger.debug(f"Document ID: {payload.get('record_id', '')}, "
-                         f"Title: {payload.get('title', 'N/A')}, "
-                         f"Similarity Score: {similarity_score:.4f}")
+        results = _to_results(group.hits[0] for group in groups if group.hits)
 
         if results:
-            logger.debug(f"Found {len(results)} documents matching the criteria.")
+            logger.debug("Found %d documents matching the criteria.", len(results))
         else:
             logger.warning("No documents found matching the embedding and keyword filters.")
 
@@ -217,6 +509,7 @@ async def advanced_qdrant_search(
         logger.error(f"Error during advanced Qdrant search: {e}")
         return []
 
+@lru_cache(maxsize=4096)
 def reconstruct_source(source_id: str) -> str:
     """
     Reconstruct a human-readable source string from a source_id.
@@ -226,6 +519,8 @@ def reconstruct_source(source_id: str) -> str:
       - Converts 'art' numbers to "Điều <number>".
       - Converts 'cl_' to "khoản <number>".
       - Converts 'pt_' to "điểm <label>".
+
+    Results are memoized, since the same source_id recurs across hits and queries.
     
     :param source_id: The source ID to reconstruct.
     :return: A human-readable description.
@@ -235,25 +530,17 @@ def reconstruct_source(source_id: str) -> str:
         clause = None
         point = None
 
-        art_pattern = re.compile(r'art(\d+)', re.IGNORECASE)
-        cl_pattern = re.compile(r'cl_(\d+)', re.IGNORECASE)
-        pt_pattern = re.compile(r'pt_(\w+)', re.IGNORECASE)
-
-        art_match = art_pattern.search(source_id)
-        cl_match = cl_pattern.search(source_id)
-        pt_match = pt_pattern.search(source_id)
-
         base_document = source_id.split('_')[0]
 
-        if art_match:
-            article_number = int(art_match.group(1))
-            article = f"Điều {article_number}"
-        if cl_match:
-            clause_number = int(cl_match.group(1))
-            clause = f"khoản {clause_number}"
-        if pt_match:
-            point_label = pt_match.group(1)
-            point = f"điểm {point_label}"
+        # Walk the source_id once; keep the first match of each part.
+        for match in _SOURCE_RE.finditer(source_id):
+            part = match.lastgroup
+            if part == "art" and article is None:
+                article = f"Điều {int(match.group('art'))}"
+            elif part == "cl" and clause is None:
+                clause = f"khoản {int(match.group('cl'))}"
+            elif part == "pt" and point is None:
+                point = f"điểm {match.group('pt')}"
 
         reconstructed_parts = []
         if clause:
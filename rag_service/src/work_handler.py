@@ -1,10 +1,9 @@
 # rag_service\src\handlers\work_handler.py
 
-import json
 import asyncio
-import boto3
+import aioboto3
+import orjson
 
-from functools import partial
 from hashlib import md5
 
 import os
@@ -13,16 +12,18 @@ import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from models.query_model import QueryModel
-from shared_libs.config.app_config import AppConfigLoader
+from shared_libs.config.app_config import get_app_config
 from shared_libs.utils.logger import Logger
 from shared_libs.llm_providers import ProviderFactory
 from services.query_rag import query_rag
+from services.search_qdrant import search_qdrant_batch
+from services.get_embedding_function import get_embedding_function
 
 # Initialize the logger
 logger = Logger().get_logger(module_name=__name__)
 
 # Load configuration and LLM provider
-app_config_loader = AppConfigLoader()
+app_config_loader = get_app_config()
 config = app_config_loader.config
 provider_name = config.get('llm', {}).get('provider', 'groq')
 llm_settings = config.get('llm', {}).get(provider_name, {})
@@ -31,6 +32,7 @@ llm_provider = ProviderFactory.get_provider(provider_name, llm_settings)
 # Worker configuration
 POLL_INTERVAL = 10  # seconds
 MAX_MESSAGES = 10 
+RETRIEVAL_TOP_K = 6  # documents retrieved per query, as in query_rag_v1
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 SQS_QUEUE_URL = os.environ.get("SQS_QUEUE_URL")
 DEVELOPMENT_MODE = os.getenv("DEVELOPMENT_MODE", "False").lower() in ["true", "1", "yes"]
@@ -44,12 +46,9 @@ else:
     endpoint_url = None  # Use default AWS endpoints
 
 
-# Initialize boto3 clients with explicit credentials
-sqs_client = boto3.client(
-    'sqs',
-    region_name=AWS_REGION,
-    endpoint_url=endpoint_url
-)
+# aioboto3 session; poll_queue opens one native-async SQS client for its long-polls and
+# batched deletes, so neither occupies an executor thread.
+sqs_session = aioboto3.Session()
 
 async def handler(event, context):
     """
@@ -74,7 +73,7 @@ async def handler(event, context):
         llm_provider_name = payload.get('llm_provider')
 
         # Build the QueryModel instance from the event data.
-        query_item = QueryModel(
+        query_item = QueryModel.from_trusted(
             query_id=query_id,
             query_text=query_text,
             conversation_history=conversation_history
@@ -155,7 +154,7 @@ async def process_direct_invocation(payload):
         # Save the updated query_item
         await query_item.update_item(query_id, query_item)
         
-        logger.info(f"Successfully processed query_id: {query_id}")
+        logger.info("Successfully processed query_id: %s", query_id)
         
         # Return the result
         return {
@@ -182,14 +181,47 @@ def get_llm_provider(llm_provider_name):
         provider = llm_provider
     return provider
 
-async def process_sqs_records(message):
+async def retrieve_documents(messages):
+    """
+    Embed the query of every received message and run all their Qdrant searches in a single
+    query_batch_points round trip (see search_qdrant_batch), instead of one search per message.
+
+    :param messages: The SQS messages as returned by receive_message.
+    :return: The retrieved documents per message, in message order; None where a message has
+             no query_text or its embedding failed, leaving retrieval to query_rag.
+    """
+    query_texts = []
+    for message in messages:
+        try:
+            query_texts.append(orjson.loads(message['Body']).get('query_text'))
+        except Exception:
+            query_texts.append(None)  # process_sqs_records reports malformed bodies
+
+    pending = [idx for idx, query_text in enumerate(query_texts) if query_text]
+    embedding_function = get_embedding_function()
+    vectors = await asyncio.gather(*(embedding_function(query_texts[idx]) for idx in pending))
+    embedded = [(idx, vector) for idx, vector in zip(pending, vectors) if vector is not None]
+
+    retrieved = [None] * len(messages)
+    if embedded:
+        batch_results = await search_qdrant_batch([vector for _, vector in embedded], top_k=RETRIEVAL_TOP_K)
+        for (idx, _), docs in zip(embedded, batch_results):
+            retrieved[idx] = docs
+    return retrieved
+
+async def process_sqs_records(message, retrieved_docs=None) -> bool:
     """
     Process a single SQS message.
+
+    :param message: The SQS message as returned by receive_message.
+    :param retrieved_docs: Documents already retrieved for the message by retrieve_documents.
+    :return: True if the message is done with and should be deleted from the queue.
     """
+    query_id = None
     try:
         from rag_service.src.services.deprecated.query_rag_v1 import query_rag
         # Deserialize message
-        body = json.loads(message['Body'])
+        body = orjson.loads(message['Body'])
         llm_provider_name = body.get('llm_provider')
         
         provider = get_llm_provider(llm_provider_name)
@@ -199,23 +231,21 @@ async def process_sqs_records(message):
         if not query_id:
             logger.error("No query_id found in message body.")
             # Delete the message to prevent it from being retried indefinitely
-            await delete_message(message['ReceiptHandle'])
-            return
+            return True
 
-        logger.info(f"Received message for query_id: {query_id}")
+        logger.info("Received message for query_id: %s", query_id)
         query_text = body.get('query_text')
         if not query_text:
             logger.error(f"No query_text found in message body for query_id: {query_id}")
             # Delete the message to prevent it from being retried indefinitely
-            await delete_message(message['ReceiptHandle'])
-            return
+            return True
 
         conversation_history = body.get('conversation_history', [])
 
-        logger.info(f"Processing query: {query_text}")
+        logger.info("Processing query: %s", query_text)
 
         # Create or retrieve the query from your data store (e.g., DynamoDB)
-        query_item = QueryModel(
+        query_item = QueryModel.from_trusted(
             query_id=query_id,
             query_text=query_text,
             conversation_history=conversation_history
@@ -225,7 +255,8 @@ async def process_sqs_records(message):
         response = await query_rag(
             query_item,
             conversation_history=conversation_history,
-            provider=provider
+            provider=provider,
+            retrieved_docs=retrieved_docs
         )
 
         # Update the query item with the response
@@ -236,71 +267,74 @@ async def process_sqs_records(message):
                
         # Set the response into the cache using query_text as the key
         await query_item.update_item(query_id,query_item)
-        logger.info(f"Query processed and saved for query_id: {query_id}")
+        logger.info("Query processed and saved for query_id: %s", query_id)
 
 
         # Delete the message from the queue after successful processing
-        await delete_message(message['ReceiptHandle'])
-        logger.info(f"Successfully processed and deleted message for query_id: {query_id}")
+        return True
 
     except Exception as e:
         logger.error(f"Error processing message for query_id {query_id}: {str(e)}")
         # Depending on requirements, you can decide to delete the message or leave it for retry
         # For now, we'll leave it to be retried
+        return False
 
 
-async def delete_message(receipt_handle):
+async def delete_messages(sqs, messages):
     """
-    Delete a message from the SQS queue.
+    Delete handled messages from the SQS queue in a single DeleteMessageBatch call
+    (up to MAX_MESSAGES entries, which matches the receive batch size).
     """
+    if not messages:
+        return
+    entries = [
+        {"Id": str(idx), "ReceiptHandle": message['ReceiptHandle']}
+        for idx, message in enumerate(messages)
+    ]
     try:
-        loop = asyncio.get_event_loop()
-        delete_partial = partial(
-            sqs_client.delete_message,
-            QueueUrl=SQS_QUEUE_URL,
-            ReceiptHandle=receipt_handle
-        )
-        await loop.run_in_executor(
-            None,
-            delete_partial
-        )
-        logger.debug("Message deleted from SQS.")
+        response = await sqs.delete_message_batch(QueueUrl=SQS_QUEUE_URL, Entries=entries)
+        for failure in response.get('Failed', []):
+            logger.error(f"Failed to delete message {failure.get('Id')} from SQS: {failure.get('Message')}")
+        logger.debug("Deleted %d messages from SQS.", len(response.get('Successful', [])))
     except Exception as e:
-        logger.error(f"Failed to delete message from SQS: {str(e)}")
+        logger.error(f"Failed to delete messages from SQS: {str(e)}")
 
 async def poll_queue():
     """
     Continuously poll the SQS queue for new messages.
     """
-    while True:
-        try:
-            # Receive messages with long polling
-            receive_partial = partial(
-                sqs_client.receive_message,
-                QueueUrl=SQS_QUEUE_URL,
-                MaxNumberOfMessages=MAX_MESSAGES,
-                WaitTimeSeconds=10  # Enable long polling
-            )
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                receive_partial
-            )
-
-            messages = response.get('Messages', [])
-            if not messages:
-                logger.debug("No messages received.")
-            else:
-                logger.info(f"Received {len(messages)} messages.")
-
-                # Process each message concurrently
-                tasks = [process_sqs_records(message) for message in messages]
-                await asyncio.gather(*tasks)
-
-        except Exception as e:
-            logger.error(f"Error polling SQS queue: {str(e)}")
-
-        # Wait before next poll to avoid tight loop
-        await asyncio.sleep(POLL_INTERVAL)
+    async with sqs_session.client(
+        'sqs',
+        region_name=AWS_REGION,
+        endpoint_url=endpoint_url
+    ) as sqs:
+        while True:
+            try:
+                # Receive messages with long polling
+                response = await sqs.receive_message(
+                    QueueUrl=SQS_QUEUE_URL,
+                    MaxNumberOfMessages=MAX_MESSAGES,
+                    WaitTimeSeconds=10  # Enable long polling
+                )
+
+                messages = response.get('Messages', [])
+                if not messages:
+                    logger.debug("No messages received.")
+                else:
+                    logger.info("Received %d messages.", len(messages))
+
+                    # Search for all messages in one batch, process each message concurrently,
+                    # then delete the handled ones in one call
+                    retrieved = await retrieve_documents(messages)
+                    tasks = [process_sqs_records(message, docs) for message, docs in zip(messages, retrieved)]
+                    handled = await asyncio.gather(*tasks)
+                    await delete_messages(sqs, [m for m, done in zip(messages, handled) if done])
+
+            except Exception as e:
+                logger.error(f"Error polling SQS queue: {str(e)}")
+
+            # Wait before next poll to avoid tight loop
+            await asyncio.sleep(POLL_INTERVAL)
 
 # For local testing
 
@@ -309,13 +343,10 @@ def main():
     Entry point for the worker handler.
     """
     logger.info("Worker handler started. Polling SQS queue...")
-    loop = asyncio.get_event_loop()
     try:
-        loop.run_until_complete(poll_queue())
+        asyncio.run(poll_queue())
     except KeyboardInterrupt:
         logger.info("Worker handler stopped manually.")
-    finally:
-        loop.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
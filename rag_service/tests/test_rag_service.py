@@ -1,74 +1,145 @@
 # tests/test_rag_service.py
 import os
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
+
+# Must be set before api_handler (imported below) reads the environment at import time
+os.environ.setdefault("DEVELOPMENT_MODE", "True")
+os.environ.setdefault("GROQ_API_KEY", "test-groq-api-key")
+# The API embedder: the local one downloads its model when services.query_rag is imported
+os.environ.setdefault("EMBEDDING_MODE", "cloud")
+
+import httpx
+import numpy as np
+import pytest
+from contextlib import ExitStack
+from unittest.mock import patch, AsyncMock, MagicMock
 from shared_libs.utils.deprecated.query_cache import ProcessedMessageCache
-from shared_libs.utils.deprecated.config_loader import ConfigLoader
-from shared_libs.utils.deprecated.get_provider import get_groq_provider
+from shared_libs.config.app_config import get_app_config
+from shared_libs.config.prompt_config import PromptConfigLoader
+from shared_libs.llm_providers import ProviderFactory
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# api_handler imports services.* and models.* as top-level packages, so src goes on the path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 # Import the FastAPI app and other components
-from src.handlers.api_handler import app
-from rag_service.src.services.deprecated.query_rag_v1 import query_rag, QueryResponse
-from src.models.query_model import QueryModel
+import api_handler
+from api_handler import app
+from services.query_rag import query_rag, QueryResponse
+from models.query_model import QueryModel
+from services.search_qdrant import reconstruct_source
+
+@pytest.fixture(scope="session", autouse=True)
+def app_config():
+    """
+    Load only config.yaml, once per session. Prompts and schemas live in separate
+    loaders and are never parsed for tests that do not need them.
+    """
+    return get_app_config()
+
+# One AsyncClient over an in-process ASGI transport, shared by the endpoint tests so they
+# run on a single event loop instead of TestClient spinning one up per request.
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
 
-# Initialize TestClient for API
-client = TestClient(app)
+@pytest.fixture(scope="module")
+async def aclient():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
 # Mock Data for Testing
 mock_query_text = "What are the legal implications of contract breaches?"
 mock_query_response = "The legal implications of contract breaches can include compensatory damages, restitution, rescission, etc."
 
 # Test API Endpoints
-def test_index():
+@pytest.mark.anyio
+async def test_index(aclient):
     """Test the root endpoint"""
-    response = client.get("/")
+    response = await aclient.get("/")
     assert response.status_code == 200
     assert response.json() == {"Hello": "World"}
 
-@patch("src.handlers.api_handler.QueryModel.get_item")
-def test_get_query_endpoint(mock_get_item):
+@pytest.mark.anyio
+@patch("api_handler.QueryModel.get_item", new_callable=AsyncMock)
+async def test_get_query_endpoint(mock_get_item, aclient):
     """Test the /get_query endpoint"""
-    mock_get_item.return_value = {"query_id": "12345", "query_text": mock_query_text}
-    response = client.get("/get_query", params={"query_id": "12345"})
+    mock_get_item.return_value = QueryModel(query_id="12345", query_text=mock_query_text)
+    response = await aclient.get("/get_query", params={"query_id": "12345"})
     assert response.status_code == 200
     assert response.json()["query_text"] == mock_query_text
 
-@patch("src.handlers.api_handler.query_rag")
-@patch("src.handlers.api_handler.QueryModel.put_item")
-def test_submit_query_endpoint(mock_put_item, mock_query_rag):
-    """Test the /submit_query endpoint"""
-    mock_query_rag.return_value = QueryResponse(
-        query_text=mock_query_text,
-        response_text=mock_query_response,
-        sources=["source1", "source2"]
-    )
-    response = client.post("/submit_query", json={"query_text": mock_query_text})
-    assert response.status_code == 200
-    assert response.json()["response_text"] == mock_query_response
-    assert response.json()["sources"] == ["source1", "source2"]
-
-@patch("src.rag.query_rag.search_qdrant")
-@patch("shared_libs.utils.provider_utils.get_groq_provider")
-def test_query_rag(mock_get_groq_provider, mock_search_qdrant):
-    """Unit test for query_rag functionality"""
-    mock_search_qdrant.return_value = [
-        {"record_id": "QA_1", "source": "source1", "content": "Some legal content here"},
-        {"record_id": "QA_2", "source": "source2", "content": "Another legal content here"}
-    ]
-
-    # Mocking the provider's send_single_message method
-    mock_provider = MagicMock()
-    mock_provider.send_single_message.return_value = mock_query_response
-    mock_get_groq_provider.return_value = mock_provider
-
-    # Call the function to test
-    response = query_rag(mock_query_text)
-    assert response.query_text == mock_query_text
-    assert response.response_text == mock_query_response
-    assert len(response.sources) == 2
+# (query, response) pairs run through the RAG tests below
+QUERY_CASES = [
+    (mock_query_text, mock_query_response),
+    ("What is the statute of limitations for a civil claim?", "The general limitation period for civil claims is three years."),
+    ("Can a contract be rescinded for fraud?", "Yes, a contract entered into through fraud may be declared invalid and rescinded."),
+]
+
+mock_sources = [
+    {"record_id": "QA_1", "source": "source1", "content": "Some legal content here"},
+    {"record_id": "QA_2", "source": "source2", "content": "Another legal content here"}
+]
+
+class TestRAGPipeline:
+    """The /submit_query endpoint and query_rag, run against one shared set of pipeline patches."""
+
+    @pytest.fixture(scope="class")
+    def rag_mocks(self):
+        """
+        Patch the RAG pipeline once for the whole class and undo every patch on teardown, so
+        none of them reach the cache and config tests; each parametrized case sets return
+        values on the shared mocks.
+        """
+        mock_provider = MagicMock()
+        mock_provider.send_single_message = AsyncMock()
+        with ExitStack() as stack:
+            mock_query_rag = stack.enter_context(patch("api_handler.query_rag", new_callable=AsyncMock))
+            stack.enter_context(patch.object(api_handler.intention_detector, "detect_intention",
+                                             new_callable=AsyncMock, return_value=("rag", None)))
+            stack.enter_context(patch.object(QueryModel, "get_item_by_cache_key",
+                                             new_callable=AsyncMock, return_value=None))
+            stack.enter_context(patch.object(QueryModel, "put_item", new_callable=AsyncMock))
+            stack.enter_context(patch.object(QueryModel, "update_item", new_callable=AsyncMock))
+            stack.enter_context(patch("services.query_rag._embed_fn_for_mode"))
+            stack.enter_context(patch("services.query_rag.generate_embedding", new_callable=AsyncMock,
+                                      return_value=np.ones(4, dtype=np.float32)))
+            mock_search_qdrant = stack.enter_context(patch("services.query_rag.search_qdrant_multi",
+                                                           new_callable=AsyncMock, return_value=mock_sources))
+            yield mock_query_rag, mock_search_qdrant, mock_provider
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("query_text,response_text", QUERY_CASES)
+    async def test_submit_query_endpoint(self, query_text, response_text, rag_mocks, aclient):
+        """Test the /submit_query endpoint"""
+        mock_query_rag, _, _ = rag_mocks
+        mock_query_rag.return_value = {
+            "query_response": QueryResponse(
+                query_text=query_text,
+                response_text=response_text,
+                sources=["source1", "source2"],
+                timestamp=0
+            ).model_dump()
+        }
+        response = await aclient.post("/submit_query", json={"query_text": query_text})
+        assert response.status_code == 200
+        assert response.json()["response_text"] == response_text
+        assert response.json()["sources"] == ["source1", "source2"]
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("query_text,response_text", QUERY_CASES)
+    async def test_query_rag(self, query_text, response_text, rag_mocks):
+        """Unit test for query_rag functionality"""
+        _, mock_search_qdrant, mock_provider = rag_mocks
+        mock_provider.send_single_message.return_value = response_text
+
+        # Call the function to test
+        rag_response = await query_rag(QueryModel(query_text=query_text), conversation_history=[],
+                                       provider=mock_provider)
+        response = rag_response["query_response"]
+        assert response["query_text"] == query_text
+        assert response["response_text"].startswith(response_text)  # citations are appended
+        assert response["sources"] == ["QA_1", "QA_2"]
+        mock_search_qdrant.assert_awaited()
 
 # Test Cache Functionality
 def test_cache():
@@ -87,11 +158,32 @@ def test_cache():
         assert cached_response is None
 
 # Test Config Loading
-def test_load_config():
+def test_load_config(app_config):
     """Test the config loader to ensure it loads properly"""
-    config = ConfigLoader().get_config()
-    assert "groq" in config
-    assert config.get("groq", {}).get("api_key") is not None
+    assert "groq" in app_config.get("llm", {})
+    assert app_config.get_config_value("llm.groq.model_name") == "llama-3.1-8b-instant"
+    # ${GROQ_API_KEY} is substituted from the environment (unset variables become "")
+    assert app_config.get_config_value("llm.groq.api_key") == os.environ["GROQ_API_KEY"]
+
+def test_render_prompt():
+    """PromptConfigLoader.render fills placeholders and rejects unknown names"""
+    prompts = PromptConfigLoader()
+    rendered = prompts.render("prompts.enrichment.keyword_extraction_prompt",
+                              query_text=mock_query_text, top_k=5)
+    assert mock_query_text in rendered
+    assert "top 5 keywords" in rendered
+    assert '{"keywords": [' in rendered  # escaped {{ }} come out as literal braces
+    with pytest.raises(KeyError):
+        prompts.render("prompts.enrichment.no_such_prompt")
+    with pytest.raises(KeyError):
+        prompts.render("prompts.enrichment")
+
+def test_reconstruct_source():
+    """reconstruct_source reads article, clause and point labels in any order"""
+    assert reconstruct_source("59-2020-QH14_art5_cl_3_pt_a") == "khoản 3, Điều 5, điểm a văn bản 59-2020-QH14"
+    # A point label stops at the next '_', so parts after it are still read
+    assert reconstruct_source("59-2020-QH14_pt_a_art5_cl_3") == "khoản 3, Điều 5, điểm a văn bản 59-2020-QH14"
+    assert reconstruct_source("59-2020-QH14") == "văn bản 59-2020-QH14"
 
 # Mocking Redis for Local Cache Testing (Optional)
 @patch("redis.Redis.get")
@@ -108,10 +200,11 @@ def test_redis_cache(mock_set, mock_get):
     mock_set.assert_called_once_with(mock_query_text, mock_query_response, ex=3600)
 
 # Test LLM Provider (Optional)
-@patch("shared_libs.providers.groq_provider.GroqProvider.send_single_message")
-def test_llm_provider(mock_send_single_message):
+@pytest.mark.anyio
+@patch("shared_libs.llm_providers.groq_provider.GroqProvider.send_single_message", new_callable=AsyncMock)
+async def test_llm_provider(mock_send_single_message, app_config):
     """Test the LLM provider (Groq)"""
     mock_send_single_message.return_value = mock_query_response
-    provider = get_groq_provider()
-    response = provider.send_single_message(mock_query_text)
+    provider = ProviderFactory.get_provider("groq", app_config.get("llm", {})["groq"])
+    response = await provider.send_single_message(prompt=mock_query_text)
     assert response == mock_query_response
@@ -1,4 +1,43 @@
+import sys
+from pathlib import Path
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+HERE = Path(__file__).parent.resolve()
+
+
+class BuildPyWithConfigArtifacts(build_py):
+    """
+    Add schemas.pkl, _prompts_generated.py and _config_generated.py, generated from the
+    config YAML, to the build.
+    """
+
+    def initialize_options(self):
+        super().initialize_options()
+        self.config_artifacts = []
+
+    def run(self):
+        super().run()
+        # Editable installs run from the source tree, where the loaders parse the YAML
+        if not self.editable_mode:
+            self.config_artifacts = self._build_config_artifacts()
+
+    def _build_config_artifacts(self):
+        try:
+            import yaml  # noqa: F401
+        except ImportError:
+            self.warn("PyYAML is not installed; config artifacts skipped, YAML is parsed at runtime")
+            return []
+        # shared_libs.config imports only the standard library at module level
+        sys.path.insert(0, str(HERE))
+        from shared_libs.config import build_artifacts
+        output_dir = Path(self.build_lib) / "shared_libs" / "config"
+        return [str(path) for path in build_artifacts.build_all(output_dir)]
+
+    def get_outputs(self, include_bytecode=1):
+        # The artifacts are written straight into build_lib, so list them explicitly
+        return super().get_outputs(include_bytecode) + self.config_artifacts
+
 
 setup(
     name="shared_libs",
@@ -11,13 +50,16 @@ setup(
         "requests",
         "boto3",
         "pydantic",
-        "PyYAML",
+        "PyYAML>=6.0",  # manylinux wheels bundle libyaml, used through CSafeLoader
+        "orjson>=3.9",
+        "httpx>=0.27",
         "redis",
         "python-dotenv"
         # Add other dependencies here as needed
     ],
     package_data={
-    'shared_libs.config': ['config.yaml'],  # Include config.yaml in the package data
+    'shared_libs.config': ['config.yaml', 'schemas/*.yaml', 'prompts/prompts.yaml'],
     },
+    cmdclass={'build_py': BuildPyWithConfigArtifacts},
     include_package_data=True,
 )
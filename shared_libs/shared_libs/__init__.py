@@ -0,0 +1,8 @@
+# shared_libs/__init__.py
+import os
+
+# Skip pydantic's self-check of every generated core schema at model build time. It only
+# guards against pydantic-internal bugs, costs noticeable cold-start time across the config
+# and provider models, and is a no-op on pydantic versions that no longer run it.
+# Must be set before pydantic builds any model; an explicit environment value still wins.
+os.environ.setdefault("PYDANTIC_SKIP_VALIDATING_CORE_SCHEMAS", "true")
@@ -1,21 +1,77 @@
 # shared_libs/config/__init__.py
 
-from .app_config import AppConfigLoader
-from .embedding_config import EmbeddingConfig
+from .app_config import AppConfigLoader, get_app_config
+from functools import cached_property, lru_cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .embedding_config import EmbeddingConfig
+    from .llm_config import LLMConfig
+    from .prompt_config import PromptConfigLoader
+    from .qdrant_config import QdrantConfig
+
+# The section configs are imported on first use, so importing the package for
+# AppConfigLoader alone does not pay for pydantic or the prompt loader.
+_LAZY = {
+    "EmbeddingConfig": ".embedding_config",
+    "LLMConfig": ".llm_config",
+    "PromptConfigLoader": ".prompt_config",
+    "QdrantConfig": ".qdrant_config",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-from .llm_config import LLMConfig
-from .prompt_config import PromptConfigLoader
-from .qdrant_config import QdrantConfig  
-from typing import Optional
 
 class Config:
+    """
+    Aggregate of the shared configs. Each section is built on first access, so callers
+    that only need e.g. `app` or `qdrant` do not pay for loading prompts or LLM settings.
+    """
     def __init__(self, config_path: Optional[str] = None, dotenv_path: Optional[str] = None):
-        self.app = AppConfigLoader(config_path=config_path)
-        self.embedding = EmbeddingConfig.get_embed_config(self.app)
-        self.llm = LLMConfig.from_app_config(self.app)
-        self.prompts = PromptConfigLoader()
-        self.qdrant = QdrantConfig.from_config_loader(self.app) 
+        self.config_path = config_path
+        self.dotenv_path = dotenv_path
+
+    @cached_property
+    def app(self) -> AppConfigLoader:
+        return AppConfigLoader(config_path=self.config_path) if self.config_path else get_app_config()
+
+    @cached_property
+    def embedding(self) -> 'EmbeddingConfig':
+        from .embedding_config import EmbeddingConfig
+        return EmbeddingConfig.get_embed_config(self.app)
+
+    @cached_property
+    def llm(self) -> 'LLMConfig':
+        from .llm_config import LLMConfig
+        return LLMConfig.from_app_config(self.app)
+
+    @cached_property
+    def prompts(self) -> 'PromptConfigLoader':
+        from .prompt_config import PromptConfigLoader
+        return PromptConfigLoader()
+
+    @cached_property
+    def qdrant(self) -> 'QdrantConfig':
+        from .qdrant_config import QdrantConfig
+        return QdrantConfig.from_config_loader(self.app)
 
     @staticmethod
-    def load(config_path: Optional[str] = None, dotenv_path: Optional[str] = None) -> 'Config':
+    @lru_cache(maxsize=None)
+    def _load_cached(config_path: Optional[str], dotenv_path: Optional[str]) -> 'Config':
         return Config(config_path=config_path, dotenv_path=dotenv_path)
+
+    @staticmethod
+    def load(config_path: Optional[str] = None, dotenv_path: Optional[str] = None) -> 'Config':
+        """
+        Shared Config for a (config_path, dotenv_path) pair; repeated calls reuse the
+        already-loaded sections instead of re-reading the YAML.
+        """
+        return Config._load_cached(config_path, dotenv_path)
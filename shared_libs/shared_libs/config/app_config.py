@@ -1,49 +1,122 @@
 # shared_libs/config/app_config.py
-from pydantic import Field
 from pathlib import Path
-from .base_loader import BaseConfigLoader
-from typing import Optional
-from dotenv import load_dotenv
+import copy
+import threading
+from .base_loader import BaseConfigLoader, _flatten
+from .yaml_io import source_digest
+from typing import Any, Dict, Optional, Set
+from functools import lru_cache
 from logging import Logger
 logger = Logger(__name__)
 
+# .env files already applied to os.environ in this process. load_dotenv never overrides
+# existing variables, so reading the same file again cannot change anything.
+_DOTENV_LOADED: Set[str] = set()
+
 class AppConfigLoader(BaseConfigLoader):
     CONFIG_DIR: Path = Path(__file__).parent.resolve()
     CONFIG_FILE_PATH: Path = CONFIG_DIR / 'config.yaml'
-    config_path: Optional[Path] = Field(None, description="Path to the configuration file.")
-    dotenv_path: Optional[str] = Field(None, description="Path to the .env file.")
-    config: dict = {}
+    DOTENV_FILE_PATH: Path = CONFIG_DIR / '.env'
 
     def __init__(self, config_path: Optional[str] = None, dotenv_path: Optional[str] = None):
-        super().__init__()
+        self.dotenv_path = dotenv_path
         self.config_path = Path(config_path) if config_path else self.CONFIG_FILE_PATH
-        self.load_configuration(dotenv_path)
+        self._config: Optional[Dict[str, Any]] = None
+        self._config_index: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # The .env file stays eager: modules read os.getenv right after building the loader.
+        # Parsing config.yaml is deferred until the configuration is first read.
+        self._load_environment_variables(dotenv_path)
 
     def load_configuration(self, dotenv_path: Optional[str]):
         # Load environment variables
-        self._load_environment_variables(Path(dotenv_path) if dotenv_path else None)
+        self._load_environment_variables(dotenv_path)
 
         # Load YAML configuration
-        self.config = self.load_yaml(self.config_path)
+        self._load_yaml_config()
+
+    def _load_yaml_config(self):
+        config = self._load_generated()
+        if config is None:
+            config = self.load_yaml(self.config_path)
+        self._config_index = _flatten(config)
+        self._config = config
+
+    def _load_generated(self) -> Optional[Dict[str, Any]]:
+        """
+        Configuration from the build-time _config_generated.py (see build_artifacts.py), used
+        only for the default config.yaml and only when it was generated from the file as it is now.
+        """
+        if self.config_path != self.CONFIG_FILE_PATH:
+            return None
+        try:
+            from . import _config_generated as generated
+        except ImportError:
+            return None
+        try:
+            if generated.SOURCE_DIGEST != source_digest(self.config_path):
+                return None
+        except OSError:
+            return None
+        # The module dict is shared by every loader; substitution rewrites strings in place
+        return self._substitute_env_vars(copy.deepcopy(generated.CONFIG))
 
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    self._load_yaml_config()
+        return self._config
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """
+        The parsed configuration. get_app_config() shares one loader across the process, so
+        treat it as read-only; copy.deepcopy it before modifying. It stays a plain dict so
+        callers can still deepcopy, json.dumps or splat any section.
+        """
+        return self._ensure_loaded()
+
+    @property
+    def config_index(self) -> Dict[str, Any]:
+        self._ensure_loaded()
+        return self._config_index
 
     def get(self, key: str, default=None):
         return self.config.get(key, default)
+
+    def get_config_value(self, key: str, default=None):
+        """
+        Look up a value by dotted path, e.g. 'qdrant.api.url', in a single dict access.
+        """
+        return self.config_index.get(key, default)
         
-    def _load_environment_variables(self, dotenv_path: Optional[Path] = None):
+    def _load_environment_variables(self, dotenv_path: Optional[str] = None):
         try:
-            # Default to a `.env` file in the CONFIG_DIR if no path is provided
-            dotenv_file = Path(dotenv_path) if dotenv_path else self.CONFIG_DIR / ".env"
+            # Default to the `.env` file in CONFIG_DIR (resolved once at import) if no path is provided
+            dotenv_file = Path(dotenv_path) if dotenv_path else self.DOTENV_FILE_PATH
 
+            resolved = str(dotenv_file.resolve())
+            if resolved in _DOTENV_LOADED:
+                return
             if dotenv_file.exists():
+                # Imported here so processes without a .env file never load python-dotenv
+                from dotenv import load_dotenv
                 load_dotenv(dotenv_file)
-                logger.debug(f"Loaded environment variables from '{dotenv_file}'.")
+                _DOTENV_LOADED.add(resolved)
+                logger.debug("Loaded environment variables from '%s'.", dotenv_file)
             else:
-                logger.warning(f".env file not found at '{dotenv_file}'")
+                logger.warning(".env file not found at '%s'", dotenv_file)
         except Exception as e:
             logger.error(f"Unexpected error loading environment variables: {e}")
             raise
 
 
-
-
+@lru_cache(maxsize=1)
+def get_app_config() -> AppConfigLoader:
+    """
+    Process-wide AppConfigLoader for the default config.yaml and .env, so every module
+    shares one parsed configuration instead of re-reading the YAML at import.
+    Construct AppConfigLoader directly when a different config_path is needed.
+    """
+    return AppConfigLoader()
@@ -1,52 +1,119 @@
 # shared_libs/config/base_loader.py
 from pathlib import Path
-import yaml
 import logging
 import os
+import pickle
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from .yaml_io import parse_yaml_file
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class BaseConfigLoader(BaseSettings):
-    class Config:
-        env_file = ".env"
-        env_file_encoding = 'utf-8'
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+def _env_var_resolver():
+    """
+    Build a replacement callback for _ENV_VAR_RE.sub that resolves each variable once,
+    so a name repeated across a document costs one lookup and one warning.
+    """
+    resolved: Dict[str, str] = {}
+
+    def _env_var_value(match: "re.Match") -> str:
+        var = match.group(1)
+        env_value = resolved.get(var)
+        if env_value is None:
+            env_value = os.environ.get(var, "")
+            if not env_value:
+                logger.warning("Environment variable '%s' not found. Using empty string as a fallback.", var)
+            resolved[var] = env_value
+        return env_value
+
+    return _env_var_value
+
+@lru_cache(maxsize=64)
+def _parsed_yaml_blob(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Pickled raw parse of a YAML file, memoized per process by (path, mtime, size) so an
+    edited file is parsed again. The parse is from before ${VAR} substitution; packaged
+    schemas, prompts and config.yaml skip parsing entirely through the build artifacts.
+    """
+    return pickle.dumps(parse_yaml_file(Path(path)), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_yaml_cached(file_path: Path) -> Any:
+    """
+    Parse a YAML file through the (path, mtime, size)-keyed cache. Every call unpickles
+    its own copy, so callers may mutate the result without touching the cached parse.
+    """
+    stat = file_path.stat()
+    return pickle.loads(_parsed_yaml_blob(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+def _flatten(data: Any) -> Dict[str, Any]:
+    """
+    Index a nested mapping by dotted path, e.g. {"a": {"b": 1}} -> {"a": {"b": 1}, "a.b": 1}.
+    Intermediate mappings are kept so lookups of a section still return the sub-dict.
+    """
+    flat: Dict[str, Any] = {}
+    if not isinstance(data, dict):
+        return flat
+    stack = [("", data)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                stack.append((f"{path}.", value))
+    return flat
+
+
+class BaseConfigLoader:
+    """
+    Shared YAML loading for the config loaders. A plain class: the loaders hold parsed
+    YAML rather than declarative settings, so there is nothing for pydantic to validate.
+    """
 
     def load_yaml(self, file_path: Path) -> Dict[str, Any]:
+        # Imported here so processes served from the build artifacts never load PyYAML
+        import yaml
         try:
             if file_path.exists():
-                with file_path.open('r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    return self._substitute_env_vars(data)
+                data = _load_yaml_cached(file_path)
+                return self._substitute_env_vars(data)
             else:
                 logger.warning(f"YAML file not found at '{file_path}'")
                 return {}
         except yaml.YAMLError as ye:
             logger.error(f"YAML parsing error in '{file_path}': {ye}")
             raise
-        except Exception as e:
-            logger.error(f"Unexpected error loading YAML file '{file_path}': {e}")
-            raise
 
     def _substitute_env_vars(self, obj):
-        if isinstance(obj, dict):
-            return {k: self._substitute_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._substitute_env_vars(element) for element in obj]
-        elif isinstance(obj, str):
-            pattern = re.compile(r'\$\{([^}]+)\}')
-            matches = pattern.findall(obj)
-            for var in matches:
-                env_value = os.getenv(var, "")
-                if not env_value:
-                    logger.warning(f"Environment variable '{var}' not found. Using empty string as a fallback.")
-                obj = obj.replace(f"${{{var}}}", env_value)
-            return obj
-        else:
-            return obj
+        """
+        Replace ${VAR} references in every string of a freshly parsed YAML document.
+        Containers are walked with an explicit stack and updated in place; only strings
+        that contain '${' reach the regex.
+        """
+        _env_var_value = _env_var_resolver()
+        if isinstance(obj, str):
+            return _ENV_VAR_RE.sub(_env_var_value, obj) if '${' in obj else obj
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                items = node.items()
+            elif isinstance(node, list):
+                items = enumerate(node)
+            else:
+                continue
+            for key, value in items:
+                if isinstance(value, str):
+                    if '${' in value:
+                        node[key] = _ENV_VAR_RE.sub(_env_var_value, value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        return obj
         
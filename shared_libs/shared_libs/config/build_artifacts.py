@@ -0,0 +1,92 @@
+# shared_libs/config/build_artifacts.py
+"""
+Build-time artifacts that let the config loaders skip YAML parsing at startup:
+
+- schemas/schemas.pkl: every schemas/*.yaml bundled for SchemaConfigLoader, so one
+  pickle.load replaces a parse per file.
+- _prompts_generated.py: prompts/prompts.yaml emitted as a Python dict literal for
+  PromptConfigLoader, so loading prompts is an import served from the .pyc cache.
+- _config_generated.py: config.yaml emitted the same way for AppConfigLoader, so a cold
+  start imports the configuration instead of parsing it.
+
+${VAR} references are stored verbatim and substituted at load time, so no artifact holds
+environment values. `setup.py build_py` writes them into the build directory only;
+to generate them in a source checkout, run:
+
+    python -m shared_libs.config.build_artifacts
+"""
+import pickle
+import pprint
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .yaml_io import SCHEMAS_BUNDLE_NAME, parse_yaml_file, source_digest
+
+CONFIG_DIR = Path(__file__).parent
+SCHEMAS_DIR_PATH = CONFIG_DIR / "schemas"
+PROMPTS_FILE_PATH = CONFIG_DIR / "prompts" / "prompts.yaml"
+PROMPTS_MODULE_PATH = CONFIG_DIR / "_prompts_generated.py"
+CONFIG_FILE_PATH = CONFIG_DIR / "config.yaml"
+CONFIG_MODULE_PATH = CONFIG_DIR / "_config_generated.py"
+
+
+def build_schemas_bundle(schemas_dir: Path = SCHEMAS_DIR_PATH,
+                         bundle_path: Optional[Path] = None) -> Path:
+    """
+    Parse every *.yaml in schemas_dir and pickle the {stem: schema} mapping (next to them
+    unless bundle_path is given), with a {stem: digest} map of the sources it was built from.
+    """
+    schemas: Dict[str, Any] = {}
+    digests: Dict[str, str] = {}
+    for schema_file in sorted(schemas_dir.glob("*.yaml")):
+        schemas[schema_file.stem] = parse_yaml_file(schema_file)
+        digests[schema_file.stem] = source_digest(schema_file)
+
+    bundle_path = bundle_path or schemas_dir / SCHEMAS_BUNDLE_NAME
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    with bundle_path.open("wb") as f:
+        pickle.dump((digests, schemas), f, protocol=5)
+    return bundle_path
+
+
+def _write_literal_module(source_path: Path, module_path: Path, name: str) -> Path:
+    """
+    Emit a YAML file as a module-level dict literal called name. The source digest is
+    recorded so the loader can ignore a module generated from a different file.
+    """
+    data = parse_yaml_file(source_path) or {}
+    module_path.write_text(
+        f"# Generated by build_artifacts.py from {source_path.name}; do not edit.\n"
+        f"SOURCE_DIGEST = {source_digest(source_path)!r}\n"
+        f"{name} = {pprint.pformat(data, width=100, sort_dicts=False)}\n",
+        encoding="utf-8",
+    )
+    return module_path
+
+
+def build_prompts_module(prompts_path: Path = PROMPTS_FILE_PATH,
+                         module_path: Path = PROMPTS_MODULE_PATH) -> Path:
+    """Emit prompts.yaml as the PROMPTS dict of _prompts_generated.py."""
+    return _write_literal_module(prompts_path, module_path, "PROMPTS")
+
+
+def build_config_module(config_path: Path = CONFIG_FILE_PATH,
+                        module_path: Path = CONFIG_MODULE_PATH) -> Path:
+    """Emit config.yaml as the CONFIG dict of _config_generated.py."""
+    return _write_literal_module(config_path, module_path, "CONFIG")
+
+
+def build_all(output_dir: Path = CONFIG_DIR) -> List[Path]:
+    """
+    Build every artifact from the YAML next to this module into output_dir, laid out like
+    the config package (the source tree by default, the build directory from setup.py).
+    """
+    return [
+        build_schemas_bundle(SCHEMAS_DIR_PATH, output_dir / "schemas" / SCHEMAS_BUNDLE_NAME),
+        build_prompts_module(PROMPTS_FILE_PATH, output_dir / PROMPTS_MODULE_PATH.name),
+        build_config_module(CONFIG_FILE_PATH, output_dir / CONFIG_MODULE_PATH.name),
+    ]
+
+
+if __name__ == "__main__":
+    build_all()
@@ -1,8 +1,20 @@
 # shared_libs/config/embedding_config.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Union
 from .provider_registry import ProviderRegistry
 import os
+import threading
+import weakref
+
+# Provider section that must hold the default provider, by embedding mode; any other
+# mode (including the default 'local') resolves against library_providers.
+_MODE_BUCKETS = {"api": "api_providers"}
+
+# from_config_loader results per loader: (the loader's config mapping they were built from,
+# {environment overrides: instance}). A reload gives the loader a new mapping, which
+# discards the entry. Mutated from concurrent requests, so guarded by _INTERNED_LOCK.
+_INTERNED: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_INTERNED_LOCK = threading.Lock()
 
 class EmbeddingConfig(BaseModel):
     default_provider: str = Field(..., description="Default provider for embedding service.")
@@ -12,22 +24,54 @@ class EmbeddingConfig(BaseModel):
     library_providers: Dict[str, Dict[str, Union[str, int, float]]]
     vector_dimension: int = Field(..., description="Vector dimension for the default provider.")
 
-    class Config:
-        arbitrary_types_allowed = True
+    # defer_build: the core schema is built on first validation instead of at import
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
 
     @classmethod
     def get_embed_config(cls, app_config) -> "EmbeddingConfig":
-        emb = dict(app_config.config.get("embedding", {}) or {})
+        """
+        Build and validate the embedding config; use this for the first load in a process.
+        """
+        return cls(**cls._embed_fields(app_config))
+
+    @classmethod
+    def from_config_loader(cls, app_config) -> "EmbeddingConfig":
+        """
+        Fast path for trusted config.yaml data: the same provider checks as get_embed_config,
+        but built with model_construct so pydantic's field validation is skipped.
+        Repeated calls with the same loaded config and environment overrides return one
+        shared instance, so per-request callers should treat the result as read-only.
+        """
+        try:
+            weakref.ref(app_config)
+        except TypeError:  # loader objects that cannot be weakly referenced are not interned
+            return cls.model_construct(**cls._embed_fields(app_config))
+        env = os.environ
+        key = (cls, env.get("APP_ENV") or env.get("ENV"), env.get("ACTIVE_EMBEDDING_PROVIDER"))
+        source = app_config.config
+        with _INTERNED_LOCK:
+            entry = _INTERNED.get(app_config)
+            if entry is None or entry[0] is not source:
+                # First use, or load_configuration() reloaded the loader since these were built
+                entry = _INTERNED[app_config] = (source, {})
+            config = entry[1].get(key)
+            if config is None:
+                config = entry[1][key] = cls.model_construct(**cls._embed_fields(app_config))
+        return config
+
+    @classmethod
+    def _embed_fields(cls, app_config) -> dict:
+        emb = app_config.config.get("embedding", {}) or {}
+        env = os.environ
 
-        # Apply environment overrides if present
-        env_name = os.getenv("APP_ENV") or os.getenv("ENV")
+        # Apply environment overrides if present; the section is only copied when one applies
+        env_name = env.get("APP_ENV") or env.get("ENV")
         env_overrides = (emb.get("environments", {}) or {}).get(str(env_name), {}) if env_name else {}
         if env_overrides:
             # only override top-level keys we know about
-            for k in ("default_provider", "api_service_url", "mode"):
-                if k in env_overrides:
-                    emb[k] = env_overrides[k]
+            emb = {**emb, **{k: env_overrides[k] for k in ("default_provider", "api_service_url", "mode")
+                             if k in env_overrides}}
 
         api_providers = emb.get("api_providers", {}) or {}
         library_providers = emb.get("library_providers", {}) or {}
@@ -37,17 +81,14 @@ class EmbeddingConfig(BaseModel):
         api_service_url = emb.get("api_service_url", "")
 
         # Determine active provider (env override wins)
-        active_provider = os.getenv("ACTIVE_EMBEDDING_PROVIDER", default_provider)
+        active_provider = env.get("ACTIVE_EMBEDDING_PROVIDER", default_provider)
 
         # Validate presence of default provider in its mode bucket
-        if mode == "api":
-            default_block = api_providers.get(default_provider)
-            if default_block is None:
-                raise ValueError(f"Default provider '{default_provider}' not found in api_providers.")
-        else:
-            default_block = library_providers.get(default_provider)
-            if default_block is None:
-                raise ValueError(f"Default provider '{default_provider}' not found in library_providers.")
+        buckets = {"api_providers": api_providers, "library_providers": library_providers}
+        bucket = _MODE_BUCKETS.get(mode, "library_providers")
+        default_block = buckets[bucket].get(default_provider)
+        if default_block is None:
+            raise ValueError(f"Default provider '{default_provider}' not found in {bucket}.")
 
         # Pick vector_dimension from active provider (prefer), else default provider
         active_block = api_providers.get(active_provider) or library_providers.get(active_provider)
@@ -59,7 +100,7 @@ class EmbeddingConfig(BaseModel):
         if vec_dim is None:
             raise ValueError(f"'vector_dimension' is not defined for provider '{active_provider}'.")
 
-        return cls(
+        return dict(
             default_provider=default_provider,
             mode=mode,
             api_service_url=api_service_url,
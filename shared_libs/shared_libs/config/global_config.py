@@ -1,11 +1,12 @@
 # shared_libs/config/global_config.py
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from typing import Dict
 
-class GlobalEmbeddingConfig(BaseModel):
-    default_provider: str = Field(..., description="Default provider for embedding service.")
-    mode: str = Field(..., description="Mode of interaction: 'local' or 'api'")
-    api_service_url: str = Field(..., description="Global API URL for embedding service.")
+@dataclass(frozen=True)
+class GlobalEmbeddingConfig:
+    default_provider: str  # Default provider for embedding service.
+    mode: str  # Mode of interaction: 'local' or 'api'
+    api_service_url: str  # Global API URL for embedding service.
     api_providers: Dict[str, Dict[str, str]]
     library_providers: Dict[str, Dict[str, str]]
@@ -1,22 +1,24 @@
 # shared_libs/config/llm_config.py
-from pydantic import BaseModel, Field, SecretStr
+from dataclasses import dataclass
 from typing import Dict, Any
-from .base_loader import BaseConfigLoader
 from .app_config import AppConfigLoader
 
-class LLMProviderConfig(BaseModel):
+# Plain frozen dataclasses: these only carry config.yaml sections, with nothing for
+# pydantic to validate, so they cost no schema build at import.
+
+@dataclass(frozen=True)
+class LLMProviderConfig:
     provider: str
-    model_config = {"protected_namespaces": ()}
     # Define other LLM-specific fields
 
-class LLMConfig(BaseModel):
+@dataclass(frozen=True)
+class LLMConfig:
     llm: Dict[str, Any]
 
     @classmethod
     def from_app_config(cls, app_config: AppConfigLoader) -> 'LLMConfig':
         llm_section = app_config.get('llm', {})
         return cls(llm=llm_section)
-    
-    @classmethod
+
     def get(self, key: str, default=None):
         return self.llm.get(key, default)
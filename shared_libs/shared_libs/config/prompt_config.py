@@ -1,18 +1,80 @@
 # shared_libs/config/prompt_config.py
 from pathlib import Path
-from pydantic import BaseModel
-from typing import Dict, Optional
-from .base_loader import BaseConfigLoader
+import copy
+import threading
+from typing import Any, Callable, Dict, Optional
+from .base_loader import BaseConfigLoader, _flatten
+from .yaml_io import source_digest
 
 class PromptConfigLoader(BaseConfigLoader):
     PROMPTS_FILE_PATH: Path = Path(__file__).parent / 'prompts/prompts.yaml'
-    prompts: Dict[str, str] = {}
-    prompts_path: Path = Path(__file__).parent / 'prompts/prompts.yaml'
 
     def __init__(self, prompts_path: Optional[str] = None):
-        super().__init__()
         self.prompts_path = Path(prompts_path) if prompts_path else self.PROMPTS_FILE_PATH
-        self.prompts = self.load_yaml(self.prompts_path)
+        self._prompts: Optional[Dict[str, Any]] = None
+        self._prompts_index: Dict[str, Any] = {}
+        self._renderers: Dict[str, Callable[[Dict[str, Any]], str]] = {}
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        # prompts.yaml is parsed on first access rather than at construction
+        if self._prompts is None:
+            with self._lock:
+                if self._prompts is None:
+                    prompts = self._load_generated()
+                    if prompts is None:
+                        prompts = self.load_yaml(self.prompts_path)
+                    self._prompts_index = _flatten(prompts)
+                    self._prompts = prompts
+        return self._prompts
+
+    def _load_generated(self) -> Optional[Dict[str, Any]]:
+        """
+        Prompts from the build-time _prompts_generated.py (see build_artifacts.py), used only
+        for the default prompts.yaml and only when it was generated from the file as it is now.
+        """
+        if self.prompts_path != self.PROMPTS_FILE_PATH:
+            return None
+        try:
+            from . import _prompts_generated as generated
+        except ImportError:
+            return None
+        try:
+            if generated.SOURCE_DIGEST != source_digest(self.prompts_path):
+                return None
+        except OSError:
+            return None
+        # The module dict is shared by every loader; substitution rewrites strings in place
+        return self._substitute_env_vars(copy.deepcopy(generated.PROMPTS))
+
+    @property
+    def prompts(self) -> Dict[str, Any]:
+        return self._ensure_loaded()
+
+    @property
+    def prompts_index(self) -> Dict[str, Any]:
+        self._ensure_loaded()
+        return self._prompts_index
 
     def get_prompt(self, prompt_name: str) -> str:
-        return self.prompts.get(prompt_name, "")
+        """
+        Return a prompt (or prompt section) by name or dotted path,
+        e.g. 'prompts.rag_prompt.system_prompt'; empty string if missing.
+        """
+        return self.prompts_index.get(prompt_name, "")
+
+    def render(self, prompt_name: str, **kwargs: Any) -> str:
+        """
+        Fill a prompt's {placeholders}, e.g. render('prompts.enrichment.keyword_extraction_prompt',
+        query_text=..., top_k=...). The prompt is resolved once per name and its bound
+        str.format_map kept, so repeated renders skip the path lookup and kwargs copy.
+        """
+        renderer = self._renderers.get(prompt_name)
+        if renderer is None:
+            if prompt_name not in self.prompts_index:
+                raise KeyError(f"Prompt '{prompt_name}' not found.")
+            prompt = self.prompts_index[prompt_name]
+            if not isinstance(prompt, str):
+                raise KeyError(f"Prompt '{prompt_name}' is not a template string.")
+            renderer = self._renderers[prompt_name] = prompt.format_map
+        return renderer(kwargs)
@@ -1,15 +1,27 @@
 # shared_libs/config/provider_registry.py
 
-from typing import Dict, Tuple, Type
+from typing import TYPE_CHECKING, Dict, Tuple, Type
 import importlib
-from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 class ProviderRegistry:
     """
     Registry for managing embedding providers.
-    Stores the module path and class name for each provider.
+    Stores the module path and class name for each provider; a provider's module is
+    imported only when its class is first requested.
     """
-    _registry: Dict[str, Tuple[str, str]] = {}
+    _registry: Dict[str, Tuple[str, str]] = {
+        "cloud": ("shared_libs.embeddings.cloud_embedder", "CloudEmbedder"),
+        "local": ("shared_libs.embeddings.local_embedder", "LocalEmbedder"),
+        "local_gemma3": ("shared_libs.embeddings.gemma_embedder", "GemmaLocalEmbedder"),
+        "docker": ("shared_libs.embeddings.docker_embedder", "DockerEmbedder"),
+        "bedrock": ("shared_libs.embeddings.bedrock_embedder", "BedrockEmbedder"),
+        "openai_embedding": ("shared_libs.embeddings.openai_embedder", "OpenAIEmbedder"),
+    }
+    # Classes already resolved by get_provider_class, so import_module/getattr run once per provider
+    _class_cache: Dict[str, Type["BaseModel"]] = {}
 
     @classmethod
     def register_provider(cls, provider_name: str, module_path: str, class_name: str):
@@ -21,10 +33,16 @@ class ProviderRegistry:
             module_path (str): Path to the module containing the provider class.
             class_name (str): Name of the provider class.
         """
-        cls._registry[provider_name.lower()] = (module_path, class_name)
+        provider_name = provider_name.lower()
+        cls._registry[provider_name] = (module_path, class_name)
+        cls._class_cache.pop(provider_name, None)
 
     @classmethod
-    def get_provider_class(cls, provider_name: str) -> Type[BaseModel]:
+    def is_registered(cls, provider_name: str) -> bool:
+        return provider_name.lower() in cls._registry
+
+    @classmethod
+    def get_provider_class(cls, provider_name: str) -> Type["BaseModel"]:
         """
         Retrieve the provider class dynamically.
 
@@ -39,26 +57,19 @@ class ProviderRegistry:
             ImportError: If the module or class cannot be loaded.
         """
         provider_name = provider_name.lower()
+        provider_class = cls._class_cache.get(provider_name)
+        if provider_class is not None:
+            return provider_class
         if provider_name not in cls._registry:
             raise ValueError(f"Provider '{provider_name}' is not registered in the ProviderRegistry.")
 
         module_path, class_name = cls._registry[provider_name]
         try:
             module = importlib.import_module(module_path)
-            return getattr(module, class_name)
+            provider_class = getattr(module, class_name)
         except (ImportError, AttributeError) as e:
             raise ImportError(
                 f"Failed to load provider class '{class_name}' from module '{module_path}': {e}"
             ) from e
-
-# Register providers immediately upon module import
-ProviderRegistry.register_provider("cloud", "shared_libs.embeddings.cloud_embedder", "CloudEmbedder")
-ProviderRegistry.register_provider("local", "shared_libs.embeddings.local_embedder", "LocalEmbedder")
-ProviderRegistry.register_provider(
-    "local_gemma3",
-    "shared_libs.embeddings.gemma_embedder",
-    "GemmaLocalEmbedder",
-)
-ProviderRegistry.register_provider("docker", "shared_libs.embeddings.docker_embedder", "DockerEmbedder")
-ProviderRegistry.register_provider("bedrock", "shared_libs.embeddings.bedrock_embedder", "BedrockEmbedder")
-ProviderRegistry.register_provider("openai_embedding", "shared_libs.embeddings.openai_embedder", "OpenAIEmbedder")
\ No newline at end of file
+        cls._class_cache[provider_name] = provider_class
+        return provider_class
@@ -37,6 +37,15 @@ class QdrantConfig(BaseModel):
         True,
         description="Whether to use a local Qdrant server."
     )
+    hnsw_ef: int = Field(
+        64,
+        gt=0,
+        description="Minimum HNSW beam width for searches; raised to top_k * 4 for larger result sets."
+    )
+    quantization: str = Field(
+        "scalar",
+        description="Vector quantization for new collections. Options: 'scalar' (int8), 'binary'"
+    )
 
     @field_validator('distance_metric')
     def validate_distance_metric(cls, v):
@@ -45,6 +54,13 @@ class QdrantConfig(BaseModel):
             raise ValueError(f"Invalid distance metric '{v}'. Valid options are {valid_metrics}.")
         return v.lower()
     
+    @field_validator('quantization')
+    def validate_quantization(cls, v):
+        valid_quantizations = {'scalar', 'binary'}
+        if v.lower() not in valid_quantizations:
+            raise ValueError(f"Invalid quantization '{v}'. Valid options are {valid_quantizations}.")
+        return v.lower()
+
     @classmethod
     def from_config_loader(cls, config_loader: AppConfigLoader) -> "QdrantConfig":
         """
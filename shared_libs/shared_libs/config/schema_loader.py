@@ -1,6 +1,10 @@
 # shared_libs/config/schemas_loader.py
 from .base_loader import BaseConfigLoader
+from .yaml_io import SCHEMAS_BUNDLE_NAME, source_digest
 from pathlib import Path
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from shared_libs.utils.logger import Logger
 logger = Logger.get_logger(module_name=__name__)
@@ -9,17 +13,39 @@ class SchemaConfigLoader(BaseConfigLoader):
     SCHEMAS_DIR_PATH: Path = Path(__file__).parent / 'schemas/'
 
     def __init__(self, schemas_path: Optional[str] = None):
-        super().__init__()
         self.schemas_path = Path(schemas_path) if schemas_path else self.SCHEMAS_DIR_PATH
-        self.schemas = self.load_schemas(self.schemas_path)
+        # Schemas are parsed on demand by get_schema; `schemas` or preload() loads them all
+        self._schema_cache: Dict[str, Dict[str, Any]] = {}
+        self._preloaded = False
+
+    @property
+    def schemas(self) -> Dict[str, Any]:
+        if not self._preloaded:
+            self.preload()
+        return self._schema_cache
+
+    def preload(self) -> None:
+        """Load every schema in the directory (from schemas.pkl when it is fresh)."""
+        self._schema_cache.update(self.load_schemas(self.schemas_path))
+        self._preloaded = True
 
     def load_schemas(self, schemas_dir: Path) -> Dict[str, Any]:
         try:
             schemas = {}
             if schemas_dir.exists() and schemas_dir.is_dir():
-                for schema_file in schemas_dir.glob("*.yaml"):
-                    schema_name = schema_file.stem
-                    schemas[schema_name] = self.load_yaml(schema_file)
+                schema_files = self._schema_files(schemas_dir)
+                bundled = self._load_bundle(schemas_dir / SCHEMAS_BUNDLE_NAME, schema_files)
+                if bundled is not None:
+                    schemas = bundled
+                elif len(schema_files) > 2:
+                    # Schema files are independent; overlap their reads instead of loading serially.
+                    # One or two files are cheaper to parse than to hand to a pool.
+                    workers = min(8, os.cpu_count() or 1, len(schema_files))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        loaded = executor.map(self.load_yaml, schema_files)
+                        schemas = {f.stem: data for f, data in zip(schema_files, loaded)}
+                else:
+                    schemas = {f.stem: self.load_yaml(f) for f in schema_files}
             else:
                 logger.warning(f"Schemas directory not found at '{schemas_dir}'")
             return schemas
@@ -27,5 +53,42 @@ class SchemaConfigLoader(BaseConfigLoader):
             logger.error(f"Error loading schemas: {e}")
             raise
 
+    @staticmethod
+    def _schema_files(schemas_dir: Path) -> list:
+        """*.yaml files in schemas_dir, listed with one scandir pass and a suffix check."""
+        with os.scandir(schemas_dir) as entries:
+            return [Path(e.path) for e in entries if e.name.endswith('.yaml') and e.is_file()]
+
+    def _load_bundle(self, bundle_path: Path, schema_files: list) -> Optional[Dict[str, Any]]:
+        """
+        Load the build-time schemas.pkl (see build_artifacts.py) when it was built from exactly
+        the schema files present now; returns None so callers fall back to parsing otherwise.
+        """
+        try:
+            with bundle_path.open('rb') as f:
+                digests, schemas = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Truncated or mismatched bundles fail in many ways (EOFError, AttributeError,
+            # ImportError, TypeError, ...); the YAML sources are always the fallback.
+            logger.debug("Schema bundle '%s' is unreadable (%r); parsing YAML instead.", bundle_path, e)
+            return None
+        current = {f.stem: source_digest(f) for f in schema_files}
+        if current != digests:
+            logger.debug("Schema bundle '%s' is stale; parsing YAML instead.", bundle_path)
+            return None
+        return {name: self._substitute_env_vars(schema) for name, schema in schemas.items()}
+
     def get_schema(self, schema_name: str) -> Dict[str, Any]:
-        return self.schemas.get(schema_name, {})
+        schema = self._schema_cache.get(schema_name)
+        if schema is None:
+            if self._preloaded:
+                return {}
+            schema_file = self.schemas_path / f"{schema_name}.yaml"
+            if not schema_file.exists():
+                logger.warning("Schema '%s' not found in '%s'", schema_name, self.schemas_path)
+                return {}
+            schema = self.load_yaml(schema_file)
+            self._schema_cache[schema_name] = schema
+        return schema
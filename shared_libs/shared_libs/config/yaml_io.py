@@ -0,0 +1,40 @@
+# shared_libs/config/yaml_io.py
+"""
+YAML reading and artifact names shared by the runtime config loaders and the build step
+in build_artifacts.py, so runtime code never imports the build script.
+"""
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any
+
+YAML_READ_BUFFER = 1 << 20
+SCHEMAS_BUNDLE_NAME = "schemas.pkl"
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader():
+    """
+    Import PyYAML on first parse. Processes served entirely from the build artifacts
+    (schemas.pkl, _prompts_generated.py, _config_generated.py) never import it.
+    """
+    import yaml
+    return yaml, getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_yaml_file(file_path: Path) -> Any:
+    """
+    Parse one YAML file with libyaml when available; the single parse path shared by
+    the runtime loaders (base_loader) and the build step (build_artifacts).
+    """
+    yaml, safe_loader = _yaml_loader()
+    with file_path.open("rb", buffering=YAML_READ_BUFFER) as f:
+        return yaml.load(f, Loader=safe_loader)
+
+
+def source_digest(file_path: Path) -> str:
+    """
+    Content digest of a source file. Artifacts record it instead of mtimes, which do not
+    survive copying into images or wheel installs, so staleness checks stay reliable.
+    """
+    return blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
@@ -4,7 +4,6 @@ from typing import Dict, Type, Any
 from .base_embedder import BaseEmbedder
 from shared_libs.config.embedding_config import EmbeddingConfig
 from shared_libs.config.provider_registry import ProviderRegistry
-import importlib
 
 
 class EmbedderFactory:
@@ -73,7 +72,7 @@ class EmbedderFactory:
         provider_name = provider_name.lower()
 
         # Check if the provider is registered
-        if provider_name not in ProviderRegistry._registry:
+        if not ProviderRegistry.is_registered(provider_name):
             raise ValueError(f"Provider '{provider_name}' is not registered in the ProviderRegistry.")
 
         # Get the provider configuration
@@ -85,15 +84,8 @@ class EmbedderFactory:
         if not isinstance(specific_provider_config_dict, dict):
             raise TypeError(f"Expected a dictionary for provider configuration, got {type(specific_provider_config_dict).__name__}.")
 
-        # Dynamically load the embedder class
-        module_path, class_name = ProviderRegistry._registry[provider_name]
-        try:
-            module = importlib.import_module(module_path)
-            EmbedderClass = getattr(module, class_name)
-        except (ImportError, AttributeError) as e:
-            raise ImportError(
-                f"Failed to load embedder class '{class_name}' from module '{module_path}': {e}"
-            ) from e
+        # Dynamically load the embedder class (imported once, then served from the registry cache)
+        EmbedderClass = ProviderRegistry.get_provider_class(provider_name)
 
         # Create and return the embedder instance
         return EmbedderClass(specific_provider_config_dict)
@@ -6,9 +6,9 @@ from botocore.exceptions import ClientError
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import Logger 
-from shared_libs.utils.deprecated.config_loader import ConfigLoader
+from shared_libs.config import get_app_config
 from pathlib import Path
-config=ConfigLoader()
+config=get_app_config()
 print(f"DEVELOPMENT_MODE: {os.getenv('DEVELOPMENT_MODE')}")
 print(f"LOG_TABLE_NAME: {os.getenv('LOG_TABLE_NAME')}")
 print(f"Using AWS_REGION: {os.getenv('AWS_REGION')}")
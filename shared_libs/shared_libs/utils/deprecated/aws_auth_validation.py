@@ -3,6 +3,7 @@
 import boto3
 import os
 import logging
+from functools import lru_cache
 from botocore.exceptions import ClientError
 
 # AWS Configuration
@@ -11,14 +12,19 @@ DYNAMODB_TABLE_NAME = os.getenv("CACHE_TABLE_NAME", "CacheTable")
 LOG_TABLE_NAME = os.getenv("LOG_TABLE_NAME", "LogTable")
 S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "legal-rag-qa")
 
-# Initialize AWS resources
+# AWS resources are created on first use so importing this module makes no AWS calls
 
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
-    
-s3 = boto3.client("s3", region_name=AWS_REGION)
+@lru_cache(maxsize=1)
+def _dynamodb():
+    return boto3.resource("dynamodb", region_name=AWS_REGION)
+
+@lru_cache(maxsize=1)
+def _s3():
+    return boto3.client("s3", region_name=AWS_REGION)
 
 def validate_dynamodb(table_name):
     """Ensure that the specified DynamoDB table exists."""
+    dynamodb = _dynamodb()
     try:
         table = dynamodb.Table(table_name)
         table.load()  # This will trigger a resource load and fail if the table does not exist
@@ -61,6 +67,7 @@ def validate_dynamodb(table_name):
 
 def validate_s3():
     """Ensure that the specified S3 bucket exists."""
+    s3 = _s3()
     try:
         # Check if the bucket exists by attempting to access its location
         s3.head_bucket(Bucket=S3_BUCKET_NAME)
@@ -1,92 +1,28 @@
 # shared_libs\shared_libs\config\config_loader.py
-from pathlib import Path
-import yaml
-import logging
+"""
+Legacy entry points kept for old imports. The YAML loaders that used to live here were
+copies of shared_libs.config; they now resolve to the single process-wide AppConfigLoader,
+so no import path loads and substitutes config.yaml a second time.
+"""
 import os
-import re
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
-from pydantic import Field, SecretStr, field_validator
-from pydantic_settings import BaseSettings
-from typing_extensions import Literal
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-from pathlib import Path
-
-# Get the absolute path to the directory containing config_loader.py
-CONFIG_DIR = Path(__file__).parent.resolve()
-CONFIG_FILE_PATH = CONFIG_DIR / 'config.yaml'
-DOTENV_FILE_PATH = CONFIG_DIR / '.env'
-PROMPTS_FILE_PATH = CONFIG_DIR / 'prompts/prompts.yaml'
-SCHEMAS_DIR_PATH = CONFIG_DIR / 'schemas/'
-
-
-# Base Configuration Loader
-class BaseConfigLoader:
-    def __init__(self):
-        pass
-
-    def _load_environment_variables(self, dotenv_path: Optional[Path] = None):
-        try:
-            dotenv_file = dotenv_path or DOTENV_FILE_PATH
-            if dotenv_file.exists():
-                load_dotenv(dotenv_file)
-                logger.debug(f"Loaded environment variables from '{dotenv_file}'.")
-            else:
-                logger.warning(f".env file not found at '{dotenv_file}'")
-        except Exception as e:
-            logger.error(f"Unexpected error loading environment variables: {e}")
-            raise
-
-    def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
-        try:
-            if file_path.exists():
-                with file_path.open('r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    return self._substitute_env_vars(data)
-            else:
-                logger.warning(f"YAML file not found at '{file_path}'")
-                return {}
-        except yaml.YAMLError as ye:
-            logger.error(f"YAML parsing error in '{file_path}': {ye}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error loading YAML file '{file_path}': {e}")
-            raise
-
-    def _load_schemas(self, schemas_dir_path: Path) -> Dict[str, Any]:
-        try:
-            schemas = {}
-            if schemas_dir_path.exists() and schemas_dir_path.is_dir():
-                for schema_file in schemas_dir_path.glob("*.yaml"):
-                    schema_name = schema_file.stem
-                    schemas[schema_name] = self._load_yaml_file(schema_file)
-                return schemas
-            else:
-                logger.warning(f"Schemas directory not found at '{schemas_dir_path}'")
-                return {}
-        except Exception as e:
-            logger.error(f"Unexpected error loading schemas from '{schemas_dir_path}': {e}")
-            raise
-
-    def _substitute_env_vars(self, obj):
-        if isinstance(obj, dict):
-            return {k: self._substitute_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._substitute_env_vars(element) for element in obj]
-        elif isinstance(obj, str):
-            pattern = re.compile(r'\$\{([^}]+)\}')
-            matches = pattern.findall(obj)
-            for var in matches:
-                env_value = os.getenv(var, "")
-                if not env_value:
-                    logger.warning(f"Environment variable '{var}' not found. Using empty string as a fallback.")
-                obj = obj.replace(f"${{{var}}}", env_value)
-            return obj
-        else:
-            return obj
+import warnings
+from typing import Dict, Any
+
+from shared_libs.config import AppConfigLoader, get_app_config
+from shared_libs.config.base_loader import BaseConfigLoader
+
+
+def ConfigLoader() -> AppConfigLoader:
+    """
+    Deprecated: use shared_libs.config.get_app_config(). Returns the shared loader rather
+    than building a new one.
+    """
+    warnings.warn(
+        "ConfigLoader is deprecated; use shared_libs.config.get_app_config()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return get_app_config()
 
 
 class LLMProviderConfigLoader:
@@ -129,141 +65,3 @@ class LLMProviderConfigLoader:
         # Add other providers as needed
         else:
             raise ValueError(f"No default configuration available for provider '{provider_name}'")
-
-
-# Embedding Configurations using Pydantic
-class BaseEmbeddingConfig(BaseSettings):
-    provider: str = Field(..., description="Name of the embedding provider.")
-
-
-class BedrockEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal['bedrock'] = 'bedrock'
-    embedding_model_name: str = Field(..., description="Bedrock model ID.")
-    region_name: str = Field(..., description="AWS region name.")
-    aws_access_key_id: SecretStr = Field(..., description="AWS access key ID.")
-    aws_secret_access_key: SecretStr = Field(..., description="AWS secret access key.")
-
-class LocalEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal["local"] = "local"
-    model_name: str = Field(..., description="Local model name.")
-    cache_dir: str = Field(..., description="Directory to cache models.")
-    vector_dimension: int = Field(..., description="Vector dimension for the embedding model.")
-   
-class OpenAIEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal['openai_embedding'] = 'openai_embedding'
-    embedding_model_name: str = Field(..., description="OpenAI model name.")
-    openai_api_key: SecretStr = Field(..., description="OpenAI API key.")
-
-class GoogleGeminiEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal['google_gemini_embedding'] = 'google_gemini_embedding'
-    embedding_model_name: str = Field(..., description="Google embedding model name.")
-    google_gemini_api_key: SecretStr = Field(..., description="Google Gemini API key.")
-
-class DockerEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal['docker'] = 'docker'
-    service_url: str = Field(..., description="Docker API service URL.")
-
-class CloudEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal['cloud'] = 'cloud'
-    service_url: str = Field(..., description="CLOUD API service URL.")
-
-class GenAIEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal['genai'] = 'genai'
-    library: str = Field(..., description="GenAI library path.")
-    function_name: str = Field(..., description="Function name to call for embedding.")
-
-class FastEmbedEmbeddingConfig(BaseEmbeddingConfig):
-    provider: Literal['fastembed'] = 'fastembed'
-    library_path: str = Field(..., description="FastEmbed library path.")
-    function_name: str = Field(..., description="Function name to call for embedding.")
-
-class EmbeddingConfig(BaseSettings):
-    api_providers: Dict[str, BaseEmbeddingConfig] = Field(
-        default_factory=dict,
-        description="API-based embedding providers."
-    )
-    library_providers: Dict[str, BaseEmbeddingConfig] = Field(
-        default_factory=dict,
-        description="Library-based embedding providers."
-    )
-
-
-    @classmethod
-    def from_config_loader(cls, config_loader: BaseConfigLoader):
-        """
-        Parses the configuration using the AppConfigLoader to build embedding configurations.
-        """
-        embedding_section = config_loader.get('embedding', {})
-
-        # Prepare containers for parsed configurations
-        parsed_api_providers = {}
-        parsed_library_providers = {}
-
-        # Parse API providers
-        api_providers = embedding_section.get('api_providers', {})
-        for provider_name, provider_data in api_providers.items():
-            if provider_name == "bedrock":
-                parsed_api_providers[provider_name] = BedrockEmbeddingConfig(
-                    embedding_model_name=provider_data['model_name'],
-                    region_name=provider_data['region_name'],
-                    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID", ""),
-                    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY", "")
-                )
-            elif provider_name == "openai_embedding":
-                parsed_api_providers[provider_name] = OpenAIEmbeddingConfig(
-                    embedding_model_name=provider_data['model_name'],
-                    openai_api_key=os.getenv("OPENAI_API_KEY", "")
-                )
-            elif provider_name == "google_gemini_embedding":
-                parsed_api_providers[provider_name] = GoogleGeminiEmbeddingConfig(
-                    embedding_model_name=provider_data['model_name'],
-                    google_gemini_api_key=os.getenv("GEMINI_API_KEY", "")
-                )
-            elif provider_name == "docker":
-                parsed_api_providers[provider_name] = DockerEmbeddingConfig(
-                    service_url=provider_data['service_url']
-                )
-            elif provider_name == "cloud":
-                parsed_api_providers[provider_name] = CloudEmbeddingConfig(
-                    service_url=provider_data['service_url']
-                )
-            # Add other API providers as needed
-
-        # Parse library providers
-        library_providers = embedding_section.get('library_providers', {})
-        if 'local' in library_providers:
-            local_config = library_providers['local']
-            parsed_library_providers['local'] = LocalEmbeddingConfig(
-                model_name=local_config['model_name'],
-                cache_dir=local_config['cache_dir']
-            )
-        if 'genai' in library_providers:
-            genai_config = library_providers['genai']
-            parsed_library_providers['genai'] = GenAIEmbeddingConfig(
-                library=genai_config['library'],
-                function_name=genai_config['function_name']
-            )
-        if 'fastembed' in library_providers:
-            fastembed_config = library_providers['fastembed']
-            parsed_library_providers['fastembed'] = FastEmbedEmbeddingConfig(
-                library_path=fastembed_config['library_path'],
-                function_name=fastembed_config['function_name']
-            )
-        # Add other library providers as needed
-
-        # Return the EmbeddingConfig instance
-        return cls(api_providers=parsed_api_providers, library_providers=parsed_library_providers)
-    
-    @classmethod
-    def get(self, key: str, default=None):
-        return self.config.get(key, default)
-
-# Example Usage
-if __name__ == "__main__":
-    # Initialize the app config loader
-    app_config_loader = BaseConfigLoader()
-    config = app_config_loader.config
-
-    # Initialize the embedding config
-    embedding_config = EmbeddingConfig.from_config_loader(app_config_loader)
-    print(embedding_config)
@@ -1,11 +1,11 @@
 # shared_libs\shared_libs\llm_providers\get_provider.py
-from shared_libs.utils.deprecated.config_loader import ConfigLoader
+from shared_libs.config import get_app_config
 from ...llm_providers.groq_provider import GroqProvider
 from ...llm_providers.openai_provider import OpenAIProvider 
 from ...llm_providers.gemini_provider import GeminiProvider
 
-# Load configuration
-config = ConfigLoader().get_config()
+# Load configuration (dotted-path index, e.g. 'llm.groq')
+config = get_app_config().config_index
 
 # Get the requirements from the configuration
 groq_config = config.get('llm.groq', {})
@@ -19,7 +19,7 @@ def get_groq_provider():
     return groq_provider
 
 def get_default_provider():
-    config = ConfigLoader().get_config()
+    config = get_app_config().config_index
     provider_name = config.get('llm.provider', 'groq')
 
     if provider_name == 'openai':
@@ -1,6 +1,6 @@
 # shared_libs/utils/provider_utils.py
 from shared_libs.llm_providers import ProviderFactory
-from shared_libs.utils.deprecated.config_loader import ConfigLoader
+from shared_libs.config import get_app_config
 
 def load_llm_provider():
     """
@@ -9,11 +9,8 @@ def load_llm_provider():
     
     :return: Instance of the provider.
     """
-    # Instantiate ConfigLoader which automatically loads the configuration
-    config_loader = ConfigLoader()
-
-    # Get the configuration dictionary
-    config = config_loader.get_config()
+    # Get the configuration from the process-wide loader
+    config = get_app_config().config
 
     # Fetch requirements if they exist in the configuration
     requirements = config.get('requirements', '')
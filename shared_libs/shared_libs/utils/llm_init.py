@@ -1,12 +1,12 @@
 # shared_libs\shared_libs\utils\llm_init.py
-from shared_libs.utils.deprecated.config_loader import AppConfigLoader, LLMProviderConfigLoader
+from shared_libs.config import get_app_config
+from shared_libs.utils.deprecated.config_loader import LLMProviderConfigLoader
 from shared_libs.llm_providers import ProviderFactory
 
 def initialize_llm_provider():
     try:
         # Load the application configuration
-        app_config_loader = AppConfigLoader()
-        config = app_config_loader.config
+        config = get_app_config().config
     except Exception as e:
         print(f"Error loading configuration: {e}")
         config = {}